@@ -0,0 +1,109 @@
+"""Damage calculations per second: the old attack/defense-only `damage`, the
+current `damage` (physical / special split plus stat stages) and the
+precomputed-table lookup `simulate` uses on each hit.
+
+    python bench/damage.py --hits 200000 --pair gyarados snorlax
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pkmon_core.battle import (STAGE_STATS, damage, hit_damage, move_row, simulate,
+                                stat_table, types)
+from pkmon_core.registry import load_roster
+
+
+def legacy_damage(attacker: dict, defender: dict, move: dict) -> int:
+    # `damage` before the physical / special split
+    power = move.get("power", 40) or 40
+    attack = attacker["stats"]["attack"]
+    defense = defender["stats"]["defense"]
+    mult = types(move["type"], defender["types"])
+    dmg = int((((2 * 50 / 5 + 2) * power * attack / defense) / 50 + 2) * mult)
+    return max(1, dmg)
+
+
+# Each case maps the same picked moves to a list of damage values.
+
+def run_legacy(A: dict, B: dict, moves: list) -> list:
+    out = []
+    for move in moves:
+        out.append(legacy_damage(A, B, move))
+    return out
+
+
+def run_damage(A: dict, B: dict, moves: list) -> list:
+    out = []
+    for move in moves:
+        out.append(damage(A, B, move))
+    return out
+
+
+def run_tables(A: dict, B: dict, moves: list) -> list:
+    # What `simulate` does per hit: per-battle tables, move rows built on first use
+    atk_table, def_table = stat_table(A), stat_table(B)
+    rows = {}
+    out = []
+    for move in moves:
+        row = rows.get(id(move))
+        if row is None:
+            row = rows[id(move)] = move_row(move, B)
+        power, mult, atk_key, def_key, _, no_damage = row
+        if no_damage:
+            out.append(0)
+            continue
+        attack = atk_table[atk_key][A["stages"][atk_key] + 6]
+        defense = def_table[def_key][B["stages"][def_key] + 6]
+        out.append(hit_damage(power, mult, attack, defense))
+    return out
+
+
+def rate(fn, n: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return n / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hits", type=int, default=200000)
+    parser.add_argument("--battles", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5, help="best of N runs per case")
+    parser.add_argument("--pair", nargs=2, default=["gyarados", "snorlax"])
+    args = parser.parse_args()
+
+    reg = load_roster()
+    A, B = reg.battler(args.pair[0]), reg.battler(args.pair[1])
+    # Staged copies, as inside `simulate`; the plain dicts are what callers
+    # of the public damage() usually pass
+    As = dict(A, stages=dict.fromkeys(STAGE_STATS, 0))
+    Bs = dict(B, stages=dict.fromkeys(STAGE_STATS, 0))
+    moves = [random.choice(A["moves"]) for _ in range(args.hits)]
+    n = args.hits
+    assert run_damage(A, B, moves) == run_damage(As, Bs, moves) == run_tables(As, Bs, moves)
+
+    results = {
+        "legacy damage()": rate(lambda: run_legacy(A, B, moves), n, args.repeat),
+        "damage()": rate(lambda: run_damage(A, B, moves), n, args.repeat),
+        "damage() staged": rate(lambda: run_damage(As, Bs, moves), n, args.repeat),
+        "table lookup": rate(lambda: run_tables(As, Bs, moves), n, args.repeat),
+    }
+    base = results["legacy damage()"]
+    for name, r in results.items():
+        print(f"{name:<16} {r:>12,.0f} hits/s  {r / base:6.2f}x")
+
+    start = time.perf_counter()
+    for s in range(args.battles):
+        simulate(A, B, seed=s)
+    print(f"\nsimulate: {args.battles / (time.perf_counter() - start):,.0f} battles/s")
+
+
+if __name__ == "__main__":
+    main()
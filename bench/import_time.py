@@ -0,0 +1,91 @@
+"""Cold-start benchmark: interpreter spawn + import time per module.
+
+    python bench/import_time.py
+    python bench/import_time.py pkmon_core.server --runs 20 --top 15
+
+For each module, reports the best and median wall time of
+`python -c "import <module>"` over several fresh processes (baseline: bare
+interpreter), then the slowest imports by cumulative time from
+`python -X importtime`.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MODULES = ["pkmon_core.battle", "pkmon_core.pokeapi", "pkmon_core.registry",
+                   "pkmon_core.server"]
+
+
+def spawn(code: str, runs: int) -> list:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                              capture_output=True, text=True)
+        times.append(time.perf_counter() - start)
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    return times
+
+
+def slowest_imports(module: str, top: int) -> list:
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=ROOT, capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cum_us, name = (p.strip() for p in line[len("import time:"):].split("|"))
+        rows.append((int(cum_us), int(self_us), name))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def roster_load_ms(runs: int) -> float:
+    code = ("import time; from pkmon_core.registry import load_roster; "
+            "t = time.perf_counter(); load_roster(); print(time.perf_counter() - t)")
+    out = []
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                              capture_output=True, text=True, check=True)
+        out.append(float(proc.stdout))
+    return min(out) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import-time benchmark")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    args = parser.parse_args()
+
+    base = spawn("pass", args.runs)
+    print(f"{'module':<24} {'best ms':>9} {'median ms':>10} {'over bare':>10}")
+    print(f"{'(bare interpreter)':<24} {min(base) * 1000:>9.1f} "
+          f"{statistics.median(base) * 1000:>10.1f} {'':>10}")
+    for module in args.modules:
+        try:
+            t = spawn(f"import {module}", args.runs)
+        except RuntimeError as e:
+            print(f"{module:<24} failed: {e}")
+            continue
+        print(f"{module:<24} {min(t) * 1000:>9.1f} {statistics.median(t) * 1000:>10.1f} "
+              f"{(min(t) - min(base)) * 1000:>10.1f}")
+
+    print(f"\nroster load (pkmon_core/data/roster.json): {roster_load_ms(args.runs):.2f} ms")
+
+    for module in args.modules:
+        rows = slowest_imports(module, args.top)
+        if not rows:
+            continue
+        print(f"\nslowest imports under {module} (cumulative ms / self ms):")
+        for cum, self_, name in rows:
+            print(f"  {cum / 1000:8.1f} {self_ / 1000:8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
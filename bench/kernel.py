@@ -0,0 +1,53 @@
+"""Battles per second: `simulate` vs the batch kernel (pure Python and Numba).
+
+    python bench/kernel.py --battles 20000 --pair charizard metagross
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pkmon_core.battle import simulate
+from pkmon_core.kernel import backend, run_battles
+from pkmon_core.registry import load_roster
+
+
+def rate(fn, n: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return n / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--battles", type=int, default=20000)
+    parser.add_argument("--max-turns", type=int, default=100)
+    parser.add_argument("--pair", nargs=2, default=["charizard", "metagross"])
+    args = parser.parse_args()
+
+    reg = load_roster()
+    A, B = reg.battler(args.pair[0]), reg.battler(args.pair[1])
+    n, seeds = args.battles, range(args.battles)
+
+    results = {
+        "simulate": rate(lambda: [simulate(A, B, seed=s, max_turns=args.max_turns)
+                                  for s in seeds], n),
+        "kernel (python)": rate(lambda: run_battles(A, B, seeds, args.max_turns,
+                                                    use_jit=False), n),
+    }
+    if backend() == "numba":
+        run_battles(A, B, range(10), args.max_turns, use_jit=True)  # compile
+        results["kernel (numba)"] = rate(lambda: run_battles(A, B, seeds, args.max_turns,
+                                                             use_jit=True), n)
+    else:
+        print("numba not installed; skipping JIT kernel")
+
+    base = results["simulate"]
+    for name, r in results.items():
+        print(f"{name:<16} {r:>12,.0f} battles/s  {r / base:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
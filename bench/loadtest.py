@@ -0,0 +1,188 @@
+"""Load test for the streamable-HTTP MCP server against a local fake PokéAPI.
+
+    python bench/loadtest.py --clients 64 --duration 20
+
+Starts a fake PokéAPI on localhost, launches `python -m pkmon_core.server
+--transport streamable-http` pointed at it, drives `simulate_battle` from
+concurrent MCP clients and prints sustained requests/s and latency
+percentiles.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SPECIES = {
+    "pikachu": (["electric"], [35, 55, 40, 50, 50, 90]),
+    "charizard": (["fire", "flying"], [78, 84, 78, 109, 85, 100]),
+    "blastoise": (["water"], [79, 83, 100, 85, 105, 78]),
+    "venusaur": (["grass", "poison"], [80, 82, 83, 100, 100, 80]),
+    "gengar": (["ghost", "poison"], [60, 65, 60, 130, 75, 110]),
+    "snorlax": (["normal"], [160, 110, 65, 65, 110, 30]),
+}
+MOVES = [
+    ("thunderbolt", "electric", 90), ("flamethrower", "fire", 90),
+    ("surf", "water", 90), ("razor-leaf", "grass", 55),
+    ("shadow-ball", "ghost", 80), ("body-slam", "normal", 85),
+    ("sludge-bomb", "poison", 90), ("ice-beam", "ice", 90),
+]
+STAT_NAMES = ["hp", "attack", "defense", "special-attack", "special-defense", "speed"]
+
+
+def fake_pokeapi(port: int) -> ThreadingHTTPServer:
+    base = f"http://127.0.0.1:{port}/api/v2"
+    names = list(SPECIES)
+
+    def pokemon(name):
+        types, stats = SPECIES[name]
+        i = names.index(name) + 1
+        return {
+            "name": name, "id": i, "height": 10, "weight": 100,
+            "types": [{"type": {"name": t}} for t in types],
+            "stats": [{"stat": {"name": s}, "base_stat": v} for s, v in zip(STAT_NAMES, stats)],
+            "abilities": [{"ability": {"name": "static"}}],
+            "moves": [{"move": {"name": m[0], "url": f"{base}/move/{j + 1}/"}}
+                      for j, m in enumerate(MOVES)],
+            "species": {"url": f"{base}/pokemon-species/{i}/"},
+        }
+
+    def move(i):
+        name, type_, power = MOVES[i - 1]
+        return {"name": name, "type": {"name": type_}, "power": power, "accuracy": 100,
+                "effect_chance": None, "effect_entries": []}
+
+    routes = [
+        (re.compile(r"/api/v2/pokemon/([a-z-]+)/?$"), lambda m: pokemon(m.group(1))),
+        (re.compile(r"/api/v2/move/(\d+)/?$"), lambda m: move(int(m.group(1)))),
+        (re.compile(r"/api/v2/pokemon-species/(\d+)/?$"),
+         lambda m: {"evolution_chain": {"url": f"{base}/evolution-chain/{m.group(1)}/"}}),
+        (re.compile(r"/api/v2/evolution-chain/(\d+)/?$"),
+         lambda m: {"chain": {"species": {"name": names[int(m.group(1)) - 1]}, "evolves_to": []}}),
+    ]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            for pattern, fn in routes:
+                m = pattern.match(self.path)
+                if m:
+                    try:
+                        body = json.dumps(fn(m)).encode()
+                    except (KeyError, IndexError):
+                        break
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+            self.send_response(404)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"server did not start on port {port}")
+
+
+async def client(url: str, deadline: float, latencies: list, errors: list) -> None:
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamablehttp_client
+
+    names = list(SPECIES)
+    async with streamablehttp_client(url) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            while time.monotonic() < deadline:
+                a, b = random.sample(names, 2)
+                start = time.perf_counter()
+                try:
+                    res = await session.call_tool("simulate_battle", {
+                        "pokemon_a": a, "pokemon_b": b, "seed": random.randrange(1 << 30)})
+                    if res.isError:
+                        errors.append(res.content[0].text if res.content else "error")
+                        continue
+                except Exception as e:
+                    errors.append(repr(e))
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+
+def percentile(values: list, p: float) -> float:
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+async def run(args) -> None:
+    api_port, mcp_port = free_port(), free_port()
+    fake_pokeapi(api_port)
+    env = dict(os.environ, POKEAPI_BASE=f"http://127.0.0.1:{api_port}/api/v2/pokemon/")
+    cmd = [sys.executable, "-m", "pkmon_core.server", "--transport", "streamable-http",
+           "--port", str(mcp_port)]
+    if args.workers:
+        cmd += ["--workers", str(args.workers)]
+    server = subprocess.Popen(cmd, cwd=ROOT, env=env)
+    try:
+        await wait_for_port(mcp_port)
+        url = f"http://127.0.0.1:{mcp_port}/mcp"
+        latencies, errors = [], []
+        start = time.monotonic()
+        deadline = start + args.duration
+        await asyncio.gather(*(client(url, deadline, latencies, errors)
+                               for _ in range(args.clients)))
+        elapsed = time.monotonic() - start
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+    print(f"clients:     {args.clients}")
+    print(f"requests:    {len(latencies)} ok, {len(errors)} errors")
+    print(f"throughput:  {len(latencies) / elapsed:.1f} req/s")
+    for p in (50, 95, 99):
+        print(f"p{p} latency: {percentile(latencies, p) * 1000:.1f} ms")
+    if errors:
+        print(f"first error: {errors[0]}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds")
+    parser.add_argument("--workers", type=int, default=None, help="server simulation processes")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
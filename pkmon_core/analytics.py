@@ -0,0 +1,152 @@
+from array import array
+from typing import Dict, List, Optional
+
+# Event kinds in the per-turn table
+HIT = 0
+STATUS_DAMAGE = 1
+PARALYZED = 2
+
+# Status codes (0 = none)
+STATUS_CODES = {None: 0, "paralysis": 1, "burn": 2, "poison": 3}
+
+BATTLE_COLUMNS = {
+    "battle_id": "q", "pokemon_a": "i", "pokemon_b": "i", "seed": "q",
+    "winner": "b", "turns": "i", "hp_a": "i", "hp_b": "i",
+}
+EVENT_COLUMNS = {
+    "battle_id": "q", "turn": "i", "side": "b", "kind": "b", "move": "i",
+    "damage": "i", "status": "b", "hp_a": "i", "hp_b": "i",
+}
+# Columns holding indices into `BattleRecorder.names`
+NAME_COLUMNS = {"pokemon_a", "pokemon_b", "move"}
+
+
+class BattleRecorder:
+    """Collects columnar per-battle and per-turn records while `simulate` runs.
+
+    Columns are typed `array.array` buffers, so `to_numpy` and `to_arrow`
+    wrap them without copying. Those views share memory with the recorder:
+    drop them before recording more battles (a resize while a view is alive
+    raises BufferError).
+
+    Battles table: battle_id, pokemon_a, pokemon_b, seed (-1 if unseeded),
+    winner (0 = A, 1 = B, -1 = draw), turns, hp_a, hp_b (remaining HP).
+    Events table: one row per hit, status tick or paralysis skip with the
+    acting side, move, damage, status applied and both HP values after it.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self.battles = {c: array(t) for c, t in BATTLE_COLUMNS.items()}
+        self.events = {c: array(t) for c, t in EVENT_COLUMNS.items()}
+        self._battle_id = 0
+
+    def __len__(self) -> int:
+        return len(self.battles["battle_id"])
+
+    def name_id(self, name: str) -> int:
+        """Dictionary-encodes Pokémon and move names."""
+        i = self._name_ids.get(name)
+        if i is None:
+            i = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def _event(self, turn, side, kind, move, dmg, status, hp_a, hp_b):
+        ev = self.events
+        ev["battle_id"].append(self._battle_id)
+        ev["turn"].append(turn)
+        ev["side"].append(int(side))
+        ev["kind"].append(kind)
+        ev["move"].append(move)
+        ev["damage"].append(dmg)
+        ev["status"].append(status)
+        ev["hp_a"].append(hp_a)
+        ev["hp_b"].append(hp_b)
+
+    def hit(self, turn: int, side: bool, move: str, dmg: int,
+            status: Optional[str], hp_a: int, hp_b: int) -> None:
+        self._event(turn, side, HIT, self.name_id(move), dmg,
+                    STATUS_CODES[status], hp_a, hp_b)
+
+    def status_damage(self, turn: int, side: bool, status: str, dmg: int,
+                      hp_a: int, hp_b: int) -> None:
+        self._event(turn, side, STATUS_DAMAGE, -1, dmg,
+                    STATUS_CODES[status], hp_a, hp_b)
+
+    def paralyzed(self, turn: int, side: bool, hp_a: int, hp_b: int) -> None:
+        self._event(turn, side, PARALYZED, -1, 0, STATUS_CODES["paralysis"],
+                    hp_a, hp_b)
+
+    def finish(self, A: dict, B: dict, seed: Optional[int], turns: int,
+               winner: int) -> None:
+        b = self.battles
+        b["battle_id"].append(self._battle_id)
+        b["pokemon_a"].append(self.name_id(A["name"]))
+        b["pokemon_b"].append(self.name_id(B["name"]))
+        b["seed"].append(-1 if seed is None else seed)
+        b["winner"].append(winner)
+        b["turns"].append(turns)
+        b["hp_a"].append(A["hp"])
+        b["hp_b"].append(B["hp"])
+        self._battle_id += 1
+
+    def to_numpy(self) -> Dict[str, dict]:
+        """Returns {"battles": {...}, "events": {...}} of zero-copy NumPy views."""
+        import numpy as np
+
+        return {
+            table: {c: np.frombuffer(col, dtype=col.typecode) for c, col in cols.items()}
+            for table, cols in (("battles", self.battles), ("events", self.events))
+        }
+
+    def to_arrow(self) -> dict:
+        """Returns {"battles": pa.Table, "events": pa.Table} over the same buffers.
+
+        Name columns are dictionary-encoded against `names`.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        arrow_types = {"q": pa.int64(), "i": pa.int32(), "b": pa.int8()}
+        names = pa.array(self.names, type=pa.string())
+
+        def table(cols):
+            arrays = {}
+            for c, col in cols.items():
+                arr = pa.Array.from_buffers(arrow_types[col.typecode], len(col),
+                                            [None, pa.py_buffer(col)])
+                if c in NAME_COLUMNS:
+                    if c == "move":
+                        # -1 marks events without a move; those indices become nulls
+                        arr = pc.if_else(pc.less(arr, 0), pa.scalar(None, arr.type), arr)
+                    arr = pa.DictionaryArray.from_arrays(arr, names)
+                arrays[c] = arr
+            return pa.table(arrays)
+
+        return {"battles": table(self.battles), "events": table(self.events)}
+
+    def write_parquet(self, prefix: str) -> List[str]:
+        """Writes `<prefix>.battles.parquet` and `<prefix>.events.parquet`."""
+        import pyarrow.parquet as pq
+
+        paths = []
+        for name, tbl in self.to_arrow().items():
+            path = f"{prefix}.{name}.parquet"
+            pq.write_table(tbl, path)
+            paths.append(path)
+        return paths
+
+    def write_ipc(self, prefix: str) -> List[str]:
+        """Writes `<prefix>.battles.arrow` and `<prefix>.events.arrow` (Arrow IPC files)."""
+        import pyarrow as pa
+
+        paths = []
+        for name, tbl in self.to_arrow().items():
+            path = f"{prefix}.{name}.arrow"
+            with pa.OSFile(path, "wb") as sink:
+                with pa.ipc.new_file(sink, tbl.schema) as writer:
+                    writer.write_table(tbl)
+            paths.append(path)
+        return paths
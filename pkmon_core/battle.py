@@ -1,6 +1,11 @@
 import random
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
+# Bump whenever a change alters battle outcomes for the same inputs and seed;
+# stored battles (pkmon_core.store) are only replayable on the same version.
+ENGINE_VERSION = "2"
+
 # Type effectiveness chart
 TYPE_CHART = {
     "normal": {"rock": 0.5, "ghost": 0.0, "steel": 0.5},
@@ -49,18 +54,76 @@ def types(move_type: str, defender_types: List[str]) -> float:
     return mult
 
 
-def damage(attacker: dict, defender: dict, move: dict) -> int:
-    power = move.get("power", 40) or 40
-    attack = attacker["stats"]["attack"]
-    defense = defender["stats"]["defense"]
-    mult = types(move["type"], defender["types"])
-    dmg = int((((2 * 50 / 5 + 2) * power * attack / defense) / 50 + 2) * mult)
-    return max(1, dmg)
+# Stat stages run from -6 to +6; index with stage + 6
+STAGE_MULTIPLIERS = tuple((2 + max(0, s)) / (2 + max(0, -s)) for s in range(-6, 7))
+STAGE_STATS = ("attack", "defense", "special-attack", "special-defense", "speed")
+
+
+def stat_keys(move: dict) -> Tuple[str, str]:
+    """Attacking / defending stat for a move; moves without a damage class are physical."""
+    if move.get("damage_class") == "special":
+        return "special-attack", "special-defense"
+    return "attack", "defense"
+
+
+@lru_cache(maxsize=None)
+def stage_values(value: int) -> Tuple[int, ...]:
+    """A stat's effective value at every stage (-6..+6)."""
+    return tuple(int(value * m) for m in STAGE_MULTIPLIERS)
+
+
+def stat_table(pokemon: dict) -> Dict[str, Tuple[int, ...]]:
+    """stage_values for each stageable stat; index with stage + 6."""
+    return {s: stage_values(pokemon["stats"][s]) for s in STAGE_STATS}
+
+
+def move_row(move: dict, defender: dict) -> tuple:
+    """Per-battle constants for a move: (power, type multiplier, attack stat,
+    defense stat, inferred status, is status move), so a hit is table lookups."""
+    atk_key, def_key = stat_keys(move)
+    return (move.get("power", 40) or 40, types(move["type"], defender["types"]),
+            atk_key, def_key, infer_moves(move), move.get("damage_class") == "status")
 
 
-def apply_status_effects(pokemon: dict, log: List[str]) -> bool:
+def hit_damage(power: int, mult: float, attack: int, defense: int) -> int:
+    """The damage formula, on already-staged attack / defense values."""
+    return max(1, int((((2 * 50 / 5 + 2) * power * attack / defense) / 50 + 2) * mult))
+
+
+def damage(attacker: dict, defender: dict, move: dict) -> int:
+    """One hit's damage, staged by any "stages" on the battlers; 0 for status moves."""
+    if move.get("damage_class") == "status":
+        return 0
+    atk_key, def_key = stat_keys(move)
+    attack = attacker["stats"][atk_key]
+    defense = defender["stats"][def_key]
+    if "stages" in attacker:
+        attack = stage_values(attack)[attacker["stages"].get(atk_key, 0) + 6]
+    if "stages" in defender:
+        defense = stage_values(defense)[defender["stages"].get(def_key, 0) + 6]
+    return hit_damage(move.get("power", 40) or 40, types(move["type"], defender["types"]),
+                      attack, defense)
+
+
+def apply_stat_changes(user: dict, target: dict, move: dict, log: List[str]) -> None:
+    """Applies a status move's stat stage changes: to the user for "user*" targets, else the opponent."""
+    who = user if (move.get("target") or "selected-pokemon").startswith("user") else target
+    for stat, change in (move.get("stat_changes") or {}).items():
+        if stat not in who["stages"] or not change:
+            continue
+        old = who["stages"][stat]
+        new = max(-6, min(6, old + change))
+        who["stages"][stat] = new
+        if new == old:
+            log.append(f"{who['name']}'s {stat} won't go any {'higher' if change > 0 else 'lower'}!")
+        else:
+            log.append(f"{who['name']}'s {stat} {'rose' if change > 0 else 'fell'}"
+                       f"{' sharply' if abs(new - old) > 1 else ''}!")
+
+
+def apply_status_effects(pokemon: dict, log: List[str], rng=random) -> bool:
     if pokemon.get("status") == "paralysis":
-        if random.random() < 0.25:
+        if rng.random() < 0.25:
             log.append(f"{pokemon['name']} is paralyzed! It can't move!")
             return True
     if pokemon.get("status") == "burn":
@@ -85,52 +148,97 @@ def infer_moves(move: dict) -> str:
     return None
 
 
-def simulate(A, B, seed=None, max_turns=100):
-    if seed is not None:
-        random.seed(seed)
+def simulate(A, B, seed=None, max_turns=100, recorder=None):
+    """Runs a battle between A and B.
+
+    If a `BattleRecorder` is passed, every event is also written to its
+    columnar buffers (see `pkmon_core.analytics`).
+
+    Randomness comes from a private `random.Random(seed)`, so the same
+    inputs and seed give the same battle even with other threads running.
+    """
+    rng = random.Random(seed)
 
     A = A.copy(); B = B.copy()
     A["hp"] = A["stats"]["hp"]
     B["hp"] = B["stats"]["hp"]
+    A["stages"] = dict.fromkeys(STAGE_STATS, 0)
+    B["stages"] = dict.fromkeys(STAGE_STATS, 0)
+
+    # Indexed by side (`p is B`): stat values per stage, and move rows filled
+    # in on first use
+    stats = (stat_table(A), stat_table(B))
+    rows = ({}, {})
 
     log = []
+    turns = 0
 
     for turn in range(max_turns):
         if A["hp"] <= 0 or B["hp"] <= 0:
             break
 
         log.append(f"--- Turn {turn+1} ---")
+        turns = turn + 1
 
-        order = sorted([A, B], key=lambda p: p["stats"]["speed"], reverse=True)
+        order = sorted([A, B], key=lambda p: stats[p is B]["speed"][p["stages"]["speed"] + 6],
+                       reverse=True)
 
         for attacker in order:
             defender = B if attacker is A else A
             if attacker["hp"] <= 0 or defender["hp"] <= 0:
                 continue
 
-            if apply_status_effects(attacker, log):
+            hp_before = attacker["hp"]
+            if apply_status_effects(attacker, log, rng):
+                if recorder is not None:
+                    recorder.paralyzed(turns, attacker is B, A["hp"], B["hp"])
                 continue
-
-            move = random.choice(attacker["moves"])
-            dmg = damage(attacker, defender, move)
-            defender["hp"] -= dmg
-            log.append(f"{attacker['name']} used {move['name']} → {defender['name']} lost {dmg} HP!")
-
-            status = infer_moves(move)
+            if recorder is not None and attacker["hp"] != hp_before:
+                recorder.status_damage(turns, attacker is B, attacker["status"],
+                                       hp_before - attacker["hp"], A["hp"], B["hp"])
+
+            side = attacker is B
+            move = rng.choice(attacker["moves"])
+            row = rows[side].get(id(move))
+            if row is None:
+                row = rows[side][id(move)] = move_row(move, defender)
+            power, mult, atk_key, def_key, status, no_damage = row
+            if no_damage:
+                dmg = 0
+                log.append(f"{attacker['name']} used {move['name']}!")
+                apply_stat_changes(attacker, defender, move, log)
+            else:
+                attack = stats[side][atk_key][attacker["stages"][atk_key] + 6]
+                defense = stats[not side][def_key][defender["stages"][def_key] + 6]
+                dmg = hit_damage(power, mult, attack, defense)
+                defender["hp"] -= dmg
+                log.append(f"{attacker['name']} used {move['name']} → {defender['name']} lost {dmg} HP!")
+
+            applied = None
             if status and not defender.get("status"):
                 defender["status"] = status
+                applied = status
                 log.append(f"{defender['name']} is now affected by {status}!")
 
+            if recorder is not None:
+                recorder.hit(turns, side, move["name"], dmg, applied,
+                             A["hp"], B["hp"])
+
             if defender["hp"] <= 0:
                 log.append(f"{defender['name']} fainted!")
+                if recorder is not None:
+                    recorder.finish(A, B, seed, turns, 1 if attacker is B else 0)
                 return {"winner": attacker["name"], "log": log}
 
   
     if A["hp"] > B["hp"]:
-        winner = A["name"]
+        winner, side = A["name"], 0
     elif B["hp"] > A["hp"]:
-        winner = B["name"]
+        winner, side = B["name"], 1
     else:
-        winner = "Draw"
+        winner, side = "Draw", -1
+
+    if recorder is not None:
+        recorder.finish(A, B, seed, turns, side)
 
     return {"winner": winner, "log": log}
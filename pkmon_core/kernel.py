@@ -0,0 +1,196 @@
+"""Batch battle kernel on integer-encoded battlers.
+
+Runs the same rules as `battle.simulate` (speed order, paralysis / burn /
+poison, type chart, physical / special split, stat stages, damage formula,
+status inference from move names) but without logging, over flat integer
+arrays. When Numba is installed the kernel is JIT-compiled on first use;
+otherwise the identical source runs as plain Python. The RNG stream differs
+from `simulate` (and between the two backends), so individual battles don't
+match seed-for-seed: only outcome distributions do.
+"""
+import os
+import random
+from functools import lru_cache
+from types import FunctionType
+from typing import Iterable, Optional, Tuple
+
+from pkmon_core.battle import STAGE_STATS, infer_moves, stat_keys, stat_table, types
+
+STATUS_CODES = {None: 0, "paralysis": 1, "burn": 2, "poison": 3}
+N_STAGE_STATS = len(STAGE_STATS)
+N_STAGES = 13  # -6..+6
+SPEED = STAGE_STATS.index("speed")
+MOVE_DAMAGE, MOVE_BOOST_USER, MOVE_BOOST_TARGET = 0, 1, 2
+
+
+def encode_pair(A: dict, B: dict, as_numpy: bool = False) -> tuple:
+    """Flattens two battle-engine dicts into the kernel's arrays.
+
+    Returns (hp, stat_tables, n_moves, move_power, move_mult, move_atk,
+    move_def, move_kind, move_stages, move_status, status, max_moves);
+    per-side blocks are laid out side 0 (A) then side 1 (B). stat_tables
+    holds every STAGE_STATS value at every stage, move_mult the type
+    multiplier against the other side, and move_stages one delta per
+    STAGE_STATS entry for status moves.
+    """
+    sides = (A, B)
+    max_moves = max(len(p["moves"]) for p in sides)
+    hp, tables, n_moves, status = [], [], [], []
+    move_power, move_mult, move_atk, move_def = [], [], [], []
+    move_kind, move_stages, move_status = [], [], []
+    for side, p in enumerate(sides):
+        other = sides[1 - side]
+        hp.append(p["stats"]["hp"])
+        table = stat_table(p)
+        for s in STAGE_STATS:
+            tables += table[s]
+        n_moves.append(len(p["moves"]))
+        status.append(STATUS_CODES[p.get("status")])
+        for m in p["moves"]:
+            atk_key, def_key = stat_keys(m)
+            move_power.append(m.get("power", 40) or 40)
+            move_mult.append(types(m["type"], other["types"]))
+            move_atk.append(STAGE_STATS.index(atk_key))
+            move_def.append(STAGE_STATS.index(def_key))
+            if m.get("damage_class") != "status":
+                move_kind.append(MOVE_DAMAGE)
+            elif (m.get("target") or "selected-pokemon").startswith("user"):
+                move_kind.append(MOVE_BOOST_USER)
+            else:
+                move_kind.append(MOVE_BOOST_TARGET)
+            changes = m.get("stat_changes") or {}
+            move_stages += [changes.get(s, 0) for s in STAGE_STATS]
+            move_status.append(STATUS_CODES[infer_moves(m)])
+        pad = max_moves - len(p["moves"])
+        move_power += [0] * pad
+        move_mult += [1.0] * pad
+        move_atk += [0] * pad
+        move_def += [0] * pad
+        move_kind += [0] * pad
+        move_stages += [0] * (pad * N_STAGE_STATS)
+        move_status += [0] * pad
+    arrays = [hp, tables, n_moves, move_power, move_mult, move_atk, move_def, move_kind,
+              move_stages, move_status, status]
+    if as_numpy:
+        import numpy as np
+        arrays = [np.asarray(a, dtype=np.float64 if a is move_mult else np.int64)
+                  for a in arrays]
+    return (*arrays, max_moves)
+
+
+def _run_batch_py(hp0, tables, n_moves, move_power, move_mult, move_atk, move_def, move_kind,
+                  move_stages, move_status, status0, max_moves, seeds, max_turns,
+                  winners, turns_out):
+    # Keep this function Numba-compatible: scalars, flat indexing, `random` only.
+    # tables[(side * N_STAGE_STATS + stat) * N_STAGES + stage + 6] is a stat at a stage.
+    hp = [0, 0]
+    st = [0, 0]
+    stages = [0] * (2 * N_STAGE_STATS)
+    for b in range(len(seeds)):
+        random.seed(seeds[b])
+        hp[0] = hp0[0]
+        hp[1] = hp0[1]
+        st[0] = status0[0]
+        st[1] = status0[1]
+        for i in range(2 * N_STAGE_STATS):
+            stages[i] = 0
+        turns = 0
+        winner = -2
+        for turn in range(max_turns):
+            if hp[0] <= 0 or hp[1] <= 0:
+                break
+            turns = turn + 1
+            speed0 = tables[SPEED * N_STAGES + stages[SPEED] + 6]
+            speed1 = tables[(N_STAGE_STATS + SPEED) * N_STAGES + stages[N_STAGE_STATS + SPEED] + 6]
+            first = 0 if speed0 >= speed1 else 1
+            for k in range(2):
+                side = first if k == 0 else 1 - first
+                other = 1 - side
+                if hp[side] <= 0 or hp[other] <= 0:
+                    continue
+                if st[side] == 1:
+                    if random.random() < 0.25:
+                        continue
+                elif st[side] == 2:
+                    hp[side] -= max(1, int(hp0[side] * 0.1))
+                elif st[side] == 3:
+                    hp[side] -= max(1, int(hp0[side] * 0.12))
+
+                j = side * max_moves + int(random.random() * n_moves[side])
+                if move_kind[j] == MOVE_DAMAGE:
+                    a = side * N_STAGE_STATS + move_atk[j]
+                    d = other * N_STAGE_STATS + move_def[j]
+                    attack = tables[a * N_STAGES + stages[a] + 6]
+                    defense = tables[d * N_STAGES + stages[d] + 6]
+                    # battle.hit_damage, inlined: Numba can't call plain Python functions
+                    dmg = int((((2 * 50 / 5 + 2) * move_power[j] * attack / defense) / 50 + 2)
+                              * move_mult[j])
+                    hp[other] -= max(1, dmg)
+                else:
+                    who = side if move_kind[j] == MOVE_BOOST_USER else other
+                    for s in range(N_STAGE_STATS):
+                        x = who * N_STAGE_STATS + s
+                        stages[x] = max(-6, min(6, stages[x] + move_stages[j * N_STAGE_STATS + s]))
+
+                if move_status[j] != 0 and st[other] == 0:
+                    st[other] = move_status[j]
+                if hp[other] <= 0:
+                    winner = side
+                    break
+            if winner != -2:
+                break
+        if winner == -2:
+            winner = 0 if hp[0] > hp[1] else 1 if hp[1] > hp[0] else -1
+        winners[b] = winner
+        turns_out[b] = turns
+
+
+def _python_kernel(rng: random.Random):
+    """`_run_batch_py` drawing from `rng` instead of the global `random` module.
+
+    Under Numba, `random` is per-thread state; in plain Python it is shared,
+    so reseeding it would race between threads and clobber the caller's state.
+    """
+    return FunctionType(_run_batch_py.__code__, dict(globals(), random=rng))
+
+
+@lru_cache(maxsize=None)
+def backend() -> str:
+    """Returns "numba" if the JIT kernel can be used, else "python".
+
+    Set PKMON_NO_JIT=1 to force the pure-Python kernel.
+    """
+    if os.environ.get("PKMON_NO_JIT"):
+        return "python"
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return "python"
+    return "numba"
+
+
+@lru_cache(maxsize=None)
+def _compiled():
+    from numba import njit
+    return njit(cache=True, nogil=True)(_run_batch_py)
+
+
+def run_battles(A: dict, B: dict, seeds: Iterable[int], max_turns: int = 100,
+                use_jit: Optional[bool] = None) -> Tuple[list, list]:
+    """Runs one battle per seed; returns (winners, turns).
+
+    winners[i] is 0 if A won, 1 if B won, -1 for a draw. With the JIT
+    backend both outputs are NumPy arrays, otherwise lists.
+    """
+    jit = backend() == "numba" if use_jit is None else use_jit
+    if jit:
+        import numpy as np
+        seeds = np.asarray(list(seeds), dtype=np.int64)
+        winners = np.empty(len(seeds), dtype=np.int8)
+        turns = np.empty(len(seeds), dtype=np.int32)
+        _compiled()(*encode_pair(A, B, as_numpy=True), seeds, max_turns, winners, turns)
+    else:
+        seeds = list(seeds)
+        winners, turns = [0] * len(seeds), [0] * len(seeds)
+        _python_kernel(random.Random())(*encode_pair(A, B), seeds, max_turns, winners, turns)
+    return winners, turns
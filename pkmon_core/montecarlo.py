@@ -0,0 +1,97 @@
+import math
+import threading
+from typing import Dict, Optional, Tuple
+
+from pkmon_core.kernel import run_battles
+
+# Battles per kernel call; also how often cancel() is checked
+CHUNK = 256
+
+
+def wilson_interval(wins: float, n: int, z: float = 1.96) -> Tuple[float, float]:
+    """Wilson score interval for a win proportion (95% by default)."""
+    if n == 0:
+        return 0.0, 1.0
+    p = wins / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+class WinRateRun:
+    """Seeded Monte Carlo battles between A and B on a background thread.
+
+    Battles run through the batch kernel (`kernel.run_battles`, JIT-compiled
+    when Numba is installed) with seeds `seed, seed + 1, ...`, so the same
+    run always gives the same estimate on a given backend. `snapshot()` can
+    be called at any time for the running totals; `cancel()` stops the
+    worker after the current chunk of battles.
+    """
+
+    def __init__(self, A: dict, B: dict, battles: int = 2000, max_turns: int = 100,
+                 seed: int = 0):
+        self.A, self.B = A, B
+        self.battles = battles
+        self.max_turns = max_turns
+        self.seed = seed
+        self.wins_a = self.wins_b = self.draws = 0
+        self.turns: Dict[int, int] = {}
+        self.error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "WinRateRun":
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    @property
+    def done(self) -> bool:
+        return not self._thread.is_alive()
+
+    @property
+    def completed(self) -> int:
+        return self.wins_a + self.wins_b + self.draws
+
+    def _run(self) -> None:
+        try:
+            for start in range(0, self.battles, CHUNK):
+                if self._cancel.is_set():
+                    return
+                seeds = range(self.seed + start, self.seed + min(start + CHUNK, self.battles))
+                winners, turns = run_battles(self.A, self.B, seeds, max_turns=self.max_turns)
+                with self._lock:
+                    for winner, n in zip(winners, turns):
+                        if winner == 0:
+                            self.wins_a += 1
+                        elif winner == 1:
+                            self.wins_b += 1
+                        else:
+                            self.draws += 1
+                        self.turns[int(n)] = self.turns.get(int(n), 0) + 1
+        except Exception as e:  # surfaced to the UI via snapshot()
+            self.error = e
+
+    def snapshot(self) -> dict:
+        """Running totals: counts, A's win rate (draws count half) with a 95% CI, turn histogram."""
+        with self._lock:
+            n = self.completed
+            score = self.wins_a + 0.5 * self.draws
+            low, high = wilson_interval(score, n)
+            return {
+                "battles": n,
+                "target": self.battles,
+                "wins_a": self.wins_a,
+                "wins_b": self.wins_b,
+                "draws": self.draws,
+                "win_rate_a": score / n if n else None,
+                "ci": (low, high),
+                "turns": dict(sorted(self.turns.items())),
+                "done": self.done,
+                "cancelled": self._cancel.is_set(),
+                "error": repr(self.error) if self.error else None,
+            }
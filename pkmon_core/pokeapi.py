@@ -0,0 +1,140 @@
+"""PokéAPI client helpers.
+
+`requests` and `tenacity` are imported on first use so that importing this
+module (and the MCP server / streamlit app that use it) stays cheap.
+
+If PKMON_SNAPSHOT points to a snapshot built by `pkmon_core.snapshot`, all
+lookups are served from it and nothing goes over the network.
+"""
+import os
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=None)
+def snapshot():
+    """The offline snapshot named by PKMON_SNAPSHOT, or None."""
+    path = os.environ.get("PKMON_SNAPSHOT")
+    if not path:
+        return None
+    from pkmon_core.snapshot import Snapshot
+    return Snapshot(path)
+
+def fetch_json(url: str) -> dict:
+    """Simple GET JSON with status check."""
+    snap = snapshot()
+    if snap is not None:
+        data = snap.get_url(url)
+        if data is None:
+            raise ValueError(f"GET {url} -> not in snapshot {snap.path}")
+        return data
+    import requests
+    r = requests.get(url, timeout=10)
+    if r.status_code != 200:
+        raise ValueError(f"GET {url} -> {r.status_code}")
+    return r.json()
+
+def move_effect(mv: dict) -> Optional[str]:
+    """Returns the effect text of a move from effect_entries (English)."""
+    for e in mv.get("effect_entries", []):
+        if e.get("language", {}).get("name") == "en":
+            return e.get("short_effect") or e.get("effect")
+    return None
+
+def build_moves_with_effects(poke_json: dict, limit: int = 8) -> list[dict]:
+    """Collects the first N moves (with power/accuracy/type/damage class) including effect text if available."""
+    out = []
+    for m in poke_json.get("moves", []):
+        mv = fetch_json(m["move"]["url"])
+        out.append({
+            "name": mv["name"],
+            "type": mv["type"]["name"],
+            "power": mv.get("power"),
+            "accuracy": mv.get("accuracy"),
+            "effect": move_effect(mv),
+            "effect_chance": mv.get("effect_chance"),
+            "damage_class": (mv.get("damage_class") or {}).get("name"),
+            "stat_changes": {c["stat"]["name"]: c["change"] for c in mv.get("stat_changes", [])},
+            "target": (mv.get("target") or {}).get("name"),
+        })
+        if len(out) >= limit:
+            break
+    if not out:
+        return [{
+            "name": "tackle", "type": "normal",
+            "power": 40, "accuracy": 100,
+            "effect": None, "effect_chance": None,
+            "damage_class": "physical", "stat_changes": {}, "target": "selected-pokemon",
+        }]
+    return out
+
+def build_chain(species_json: dict) -> list[str]:
+    """Extracts the evolution chain from species -> evolution_chain."""
+    evo_url = species_json.get("evolution_chain", {}).get("url")
+    if not evo_url:
+        return []
+    chain = fetch_json(evo_url).get("chain")
+    names: list[str] = []
+
+    def walk(node):
+        if not node:
+            return
+        names.append(node["species"]["name"])
+        for nxt in node.get("evolves_to", []):
+            walk(nxt)
+
+    walk(chain)
+    seen, ordered = set(), []
+    for n in names:
+        if n not in seen:
+            seen.add(n)
+            ordered.append(n)
+    return ordered
+
+POKEAPI_BASE = os.environ.get("POKEAPI_BASE", "https://pokeapi.co/api/v2/pokemon/")
+
+def _get_pokemon_json(name: str, timeout: float = 10) -> dict:
+    import requests
+    url = f"{POKEAPI_BASE}{name.lower()}"
+    resp = requests.get(url, timeout=timeout)
+    if resp.status_code != 200:
+        raise ValueError(f"Could not fetch data for {name}")
+    return resp.json()
+
+@lru_cache(maxsize=None)
+def _retrying_get():
+    # tenacity is only imported on the first fetch
+    from tenacity import retry, wait_exponential, stop_after_attempt
+    return retry(wait=wait_exponential(multiplier=1, min=2, max=10),
+                 stop=stop_after_attempt(3))(_get_pokemon_json)
+
+def fetch_pokemon_data(name: str, timeout: float = 10) -> dict:
+    """Fetch Pokémon JSON from PokéAPI with retry."""
+    snap = snapshot()
+    if snap is not None:
+        data = snap.get(f"pokemon/{name.lower()}")
+        if data is None:
+            raise ValueError(f"Could not fetch data for {name}")
+        return data
+    return _retrying_get()(name, timeout=timeout)
+
+
+def battle_pokemon(name: str) -> dict:
+    """Builds a Pokémon object suitable for the battle engine from PokéAPI."""
+    data = fetch_pokemon_data(name)
+    moves = build_moves_with_effects(data, limit=8)
+    raw = {s["stat"]["name"]: s["base_stat"] for s in data["stats"]}
+    stats = {
+        "hp": raw.get("hp", 50),
+        "attack": raw.get("attack", 50),
+        "defense": raw.get("defense", 50),
+        "special-attack": raw.get("special-attack", raw.get("sp-attack", 50)),
+        "special-defense": raw.get("special-defense", raw.get("sp-defense", 50)),
+        "speed": raw.get("speed", 50),
+    }
+    return {
+        "name": data["name"],
+        "types": [t["type"]["name"] for t in data["types"]],
+        "stats": stats,
+        "moves": moves,
+    }
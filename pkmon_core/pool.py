@@ -0,0 +1,65 @@
+import asyncio
+import os
+from functools import partial
+from typing import Callable, Optional
+
+
+class ServerBusy(RuntimeError):
+    """Raised when the simulation queue is full for longer than `queue_timeout`."""
+
+
+class SimulationPool:
+    """Bounded process pool for CPU-bound work called from async handlers.
+
+    At most `max_pending` jobs are queued or running; further callers wait up
+    to `queue_timeout` seconds for a slot and then get `ServerBusy`, so load
+    beyond capacity is shed instead of piling up. Each job must finish within
+    `timeout` seconds or the caller gets `asyncio.TimeoutError`; a job that is
+    already running finishes in the background and keeps its slot until then,
+    so `max_pending` bounds the work actually inside the executor.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 timeout: float = 30.0, queue_timeout: float = 5.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 4
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self._executor = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _ensure(self) -> None:
+        if self._executor is None:
+            # multiprocessing is only loaded once the first job arrives
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+
+    async def run(self, fn: Callable, *args, **kwargs):
+        self._ensure()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise ServerBusy(f"simulation queue full ({self.max_pending} pending)") from None
+        loop = asyncio.get_running_loop()
+        try:
+            job = self._executor.submit(partial(fn, *args, **kwargs))
+        except BaseException:
+            self._slots.release()
+            raise
+        job.add_done_callback(lambda _: self._release(loop))
+        return await asyncio.wait_for(asyncio.wrap_future(job), self.timeout)
+
+    def _release(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Runs in the executor's callback thread once the job is really done
+        # (or was cancelled before it started).
+        try:
+            loop.call_soon_threadsafe(self._slots.release)
+        except RuntimeError:  # loop already closed
+            pass
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
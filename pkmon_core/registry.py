@@ -0,0 +1,132 @@
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple, Union
+
+DEFAULT_ROSTER = os.path.join(os.path.dirname(__file__), "data", "roster.json")
+
+STAT_NAMES = ("hp", "attack", "defense", "special-attack", "special-defense", "speed")
+
+# (name, type ids, stats in STAT_NAMES order, move ids)
+Species = Tuple[str, Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]
+
+
+class Registry:
+    """Interned species / move / type tables with integer IDs.
+
+    Each distinct move dict is stored once and shared by every species that
+    knows it; species are kept as tuples of IDs. The whole registry is plain
+    lists and tuples, so it pickles compactly for worker processes.
+    """
+
+    def __init__(self):
+        self.types: List[str] = []
+        self.moves: List[dict] = []
+        self.species: List[Species] = []
+        self._type_ids: Dict[str, int] = {}
+        self._move_ids: Dict[str, int] = {}
+        self._species_ids: Dict[str, int] = {}
+
+    @classmethod
+    def from_roster(cls, roster: Iterable[dict]) -> "Registry":
+        """Builds a registry from battle-engine Pokémon dicts."""
+        reg = cls()
+        for pokemon in roster:
+            reg.add_species(pokemon)
+        return reg
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Registry":
+        """Inverse of `to_json`."""
+        reg = cls()
+        for t in data["types"]:
+            reg.type_id(t)
+        for m in data["moves"]:
+            reg.move_id(m)
+        for name, type_ids, stats, move_ids in data["species"]:
+            reg._species_ids[name] = len(reg.species)
+            reg.species.append((name, tuple(type_ids), tuple(stats), tuple(move_ids)))
+        return reg
+
+    def to_json(self) -> dict:
+        return {"types": self.types, "moves": self.moves,
+                "species": [[name, list(t), list(st), list(mv)]
+                            for name, t, st, mv in self.species]}
+
+    def save(self, path: str) -> None:
+        """Writes the tables as JSON, one move / species per line."""
+        data = self.to_json()
+        with open(path, "w") as f:
+            f.write('{"types": %s,\n"moves": [\n' % json.dumps(data["types"]))
+            f.write(",\n".join(json.dumps(m) for m in data["moves"]))
+            f.write('\n],\n"species": [\n')
+            f.write(",\n".join(json.dumps(sp) for sp in data["species"]))
+            f.write("\n]}\n")
+
+    def __len__(self) -> int:
+        return len(self.species)
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._species_ids
+
+    def names(self) -> List[str]:
+        return [s[0] for s in self.species]
+
+    def type_id(self, name: str) -> int:
+        i = self._type_ids.get(name)
+        if i is None:
+            i = self._type_ids[name] = len(self.types)
+            self.types.append(name)
+        return i
+
+    def move_id(self, move: dict) -> int:
+        """Interns a move dict by content and returns its ID."""
+        key = json.dumps(move, sort_keys=True)
+        i = self._move_ids.get(key)
+        if i is None:
+            i = self._move_ids[key] = len(self.moves)
+            self.moves.append(dict(move))
+            self.type_id(move["type"])
+        return i
+
+    def add_species(self, pokemon: dict) -> int:
+        """Interns a battle-engine Pokémon dict; re-adding a name replaces it."""
+        name = pokemon["name"].lower()
+        entry = (
+            name,
+            tuple(self.type_id(t) for t in pokemon["types"]),
+            tuple(pokemon["stats"][s] for s in STAT_NAMES),
+            tuple(self.move_id(m) for m in pokemon["moves"]),
+        )
+        i = self._species_ids.get(name)
+        if i is None:
+            i = self._species_ids[name] = len(self.species)
+            self.species.append(entry)
+        else:
+            self.species[i] = entry
+        return i
+
+    def species_id(self, name: str) -> int:
+        return self._species_ids[name.lower()]
+
+    def battler(self, species: Union[int, str]) -> dict:
+        """Returns a battle-engine dict whose moves are the shared interned dicts."""
+        if isinstance(species, str):
+            species = self.species_id(species)
+        name, type_ids, stats, move_ids = self.species[species]
+        return {
+            "name": name,
+            "types": [self.types[t] for t in type_ids],
+            "stats": dict(zip(STAT_NAMES, stats)),
+            "moves": [self.moves[m] for m in move_ids],
+        }
+
+
+@lru_cache(maxsize=None)
+def load_roster(path: str = DEFAULT_ROSTER) -> Registry:
+    """Loads a saved registry once per path (the bundled fallback roster by default).
+
+    The result is shared between callers; treat it as read-only.
+    """
+    with open(path) as f:
+        return Registry.from_json(json.load(f))
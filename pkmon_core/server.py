@@ -1,86 +1,22 @@
+import asyncio
 import json
-import requests
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
-from mcp.server import stdio
-from tenacity import retry, wait_exponential, stop_after_attempt
 
-
-mcp = FastMCP("pkmon-core")
+from pkmon_core.pool import SimulationPool
+from pkmon_core.pokeapi import (
+    POKEAPI_BASE,
+    battle_pokemon,
+    build_chain,
+    build_moves_with_effects,
+    fetch_json,
+    fetch_pokemon_data,
+    move_effect,
+)
 
 
-
-def fetch_json(url: str) -> dict:
-    """Simple GET JSON with status check."""
-    r = requests.get(url, timeout=10)
-    if r.status_code != 200:
-        raise ValueError(f"GET {url} -> {r.status_code}")
-    return r.json()
-
-def move_effect(mv: dict) -> Optional[str]:
-    """Returns the effect text of a move from effect_entries (English)."""
-    for e in mv.get("effect_entries", []):
-        if e.get("language", {}).get("name") == "en":
-            return e.get("short_effect") or e.get("effect")
-    return None
-
-def build_moves_with_effects(poke_json: dict, limit: int = 8) -> list[dict]:
-    """Collects the first N moves (with power/accuracy/type) including effect text if available."""
-    out = []
-    for m in poke_json.get("moves", []):
-        mv = fetch_json(m["move"]["url"])
-        out.append({
-            "name": mv["name"],
-            "type": mv["type"]["name"],
-            "power": mv.get("power"),
-            "accuracy": mv.get("accuracy"),
-            "effect": move_effect(mv),
-            "effect_chance": mv.get("effect_chance"),
-        })
-        if len(out) >= limit:
-            break
-    if not out:
-        return [{
-            "name": "tackle", "type": "normal",
-            "power": 40, "accuracy": 100,
-            "effect": None, "effect_chance": None
-        }]
-    return out
-
-def build_chain(species_json: dict) -> list[str]:
-    """Extracts the evolution chain from species -> evolution_chain."""
-    evo_url = species_json.get("evolution_chain", {}).get("url")
-    if not evo_url:
-        return []
-    chain = fetch_json(evo_url).get("chain")
-    names: list[str] = []
-
-    def walk(node):
-        if not node:
-            return
-        names.append(node["species"]["name"])
-        for nxt in node.get("evolves_to", []):
-            walk(nxt)
-
-    walk(chain)
-    seen, ordered = set(), []
-    for n in names:
-        if n not in seen:
-            seen.add(n)
-            ordered.append(n)
-    return ordered
-
-POKEAPI_BASE = "https://pokeapi.co/api/v2/pokemon/"
-
-@retry(wait=wait_exponential(multiplier=1, min=2, max=10), stop=stop_after_attempt(3))
-def fetch_pokemon_data(name: str) -> dict:
-    """Fetch Pokémon JSON from PokéAPI with retry."""
-    url = f"{POKEAPI_BASE}{name.lower()}"
-    resp = requests.get(url, timeout=10)
-    if resp.status_code != 200:
-        raise ValueError(f"Could not fetch data for {name}")
-    return resp.json()
+mcp = FastMCP("pkmon-core")
 
 
 
@@ -113,41 +49,104 @@ def get_pokemon(name: str) -> str:
     return json.dumps(info, indent=2)
 
 
-from pkmon_core.battle import simulate   
-
-def battle_pokemon(name: str) -> dict:
-    """Builds a Pokémon object suitable for the battle engine from PokéAPI."""
-    data = fetch_pokemon_data(name)
-    moves = build_moves_with_effects(data, limit=8)
-    raw = {s["stat"]["name"]: s["base_stat"] for s in data["stats"]}
-    stats = {
-        "hp": raw.get("hp", 50),
-        "attack": raw.get("attack", 50),
-        "defense": raw.get("defense", 50),
-        "special-attack": raw.get("special-attack", raw.get("sp-attack", 50)),
-        "special-defense": raw.get("special-defense", raw.get("sp-defense", 50)),
-        "speed": raw.get("speed", 50),
-    }
-    return {
-        "name": data["name"],
-        "types": [t["type"]["name"] for t in data["types"]],
-        "stats": stats,
-        "moves": moves,
-    }
+# The battle engine and team optimizer are imported inside the tools that
+# use them, so spawning the server only pays for FastMCP.
+SIM_POOL = SimulationPool()
+# Upper bound on client-supplied max_turns; status moves deal no damage, so a
+# battle can run every turn it is allowed.
+MAX_TURNS = 500
 
 @mcp.tool()
-def simulate_battle(
+async def simulate_battle(
     pokemon_a: str,
     pokemon_b: str,
     max_turns: int = 100,
     seed: Optional[int] = None,
 ) -> dict:
     """Runs a battle simulation between two Pokémon and returns the winner + log."""
-    A = battle_pokemon(pokemon_a)
-    B = battle_pokemon(pokemon_b)
-    return simulate(A, B, seed=seed, max_turns=max_turns)
+    from pkmon_core.battle import simulate
+    max_turns = max(1, min(max_turns, MAX_TURNS))
+    A, B = await asyncio.gather(
+        asyncio.to_thread(battle_pokemon, pokemon_a),
+        asyncio.to_thread(battle_pokemon, pokemon_b),
+    )
+    return await SIM_POOL.run(simulate, A, B, seed=seed, max_turns=max_turns)
+
+_MATCHUPS: dict = {}
+# Guards the shared registries and matrices in _MATCHUPS: Registry IDs are
+# assigned from list lengths, so concurrent add_species calls could collide.
+_MATCHUPS_LOCK = asyncio.Lock()
+
+@mcp.tool()
+async def optimize_team(
+    pool: list[str],
+    meta: list[str],
+    team_size: int = 6,
+    battles: int = 32,
+    max_turns: int = 100,
+    seed: Optional[int] = None,
+) -> dict:
+    """Picks the team from `pool` with the highest expected win rate against `meta`.
+
+    Win rates are cached per server process, so repeated queries only simulate new pairs.
+    """
+    from pkmon_core.registry import Registry
+    from pkmon_core.team import MatchupMatrix, best_team, load_battlers, win_rates
+
+    max_turns = max(1, min(max_turns, MAX_TURNS))
+    names = [n.lower() for n in pool], [n.lower() for n in meta]
+    key = (battles, max_turns)
+    async with _MATCHUPS_LOCK:
+        if key not in _MATCHUPS:
+            _MATCHUPS[key] = MatchupMatrix(Registry(), battles=battles, max_turns=max_turns)
+        matrix = _MATCHUPS[key]
+        await asyncio.to_thread(load_battlers, pool + meta, registry=matrix.registry)
+        todo = matrix.missing(*names)
+        pairs = [(matrix.registry.battler(a), matrix.registry.battler(b)) for a, b in todo]
+
+    # Missing cells go through the bounded simulation pool, one job per worker
+    size = max(1, -(-len(pairs) // SIM_POOL.workers))
+    jobs = [SIM_POOL.run(win_rates, pairs[i:i + size], battles, max_turns)
+            for i in range(0, len(pairs), size)]
+    results = [p for chunk in await asyncio.gather(*jobs) for p in chunk]
+
+    async with _MATCHUPS_LOCK:
+        matrix.fill(todo, results)
+        return await asyncio.to_thread(best_team, pool, meta, matrix, size=team_size, seed=seed)
+
+
+def http_app():
+    """ASGI app for the streamable-HTTP transport (e.g. `uvicorn --factory pkmon_core.server:http_app`)."""
+    mcp.settings.stateless_http = True
+    mcp.settings.json_response = True
+    return mcp.streamable_http_app()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    import argparse
+
+    global SIM_POOL
+    parser = argparse.ArgumentParser(description="pkmon-core MCP server")
+    parser.add_argument("--transport", choices=["stdio", "streamable-http"], default="stdio")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=None, help="simulation processes")
+    parser.add_argument("--max-pending", type=int, default=None,
+                        help="queued + running simulations before requests are rejected")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-simulation timeout (s)")
+    args = parser.parse_args(argv)
+
+    SIM_POOL = SimulationPool(workers=args.workers, max_pending=args.max_pending,
+                              timeout=args.timeout)
+    if args.transport == "stdio":
+        print("✅ pkmon-core MCP Server started! Waiting for requests...")
+        mcp.run()
+        return
+
+    import uvicorn
+    print(f"✅ pkmon-core MCP Server listening on http://{args.host}:{args.port}/mcp")
+    uvicorn.run(http_app(), host=args.host, port=args.port, log_level="warning")
 
 
 if __name__ == "__main__":
-    print("✅ pkmon-core MCP Server started! Waiting for requests...")
-    mcp.run()
+    main()
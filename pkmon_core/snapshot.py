@@ -0,0 +1,296 @@
+"""Offline PokéAPI snapshot.
+
+`build_snapshot` turns a local PokéAPI CSV dump (the `data/v2/csv` folder of
+the PokeAPI/pokeapi repository) into one binary file holding PokéAPI-shaped
+JSON records for every Pokémon, species, move and evolution chain.
+`Snapshot` memory-maps that file and looks records up by their API path
+("pokemon/pikachu", "move/85", ...), so `pokeapi.fetch_json` can serve them
+with no network (set PKMON_SNAPSHOT=/path/to/file).
+
+File layout (little-endian):
+    magic  b"PKSNAP1\\0"
+    u32    record count
+    u32    reserved
+    index  count x (u32 key offset, u32 key length, u32 value offset, u32 value length),
+           sorted by key
+    data   keys (UTF-8) and zlib-compressed JSON values
+"""
+import argparse
+import csv
+import json
+import mmap
+import os
+import struct
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional
+
+MAGIC = b"PKSNAP1\0"
+HEADER = struct.Struct("<8sII")
+ENTRY = struct.Struct("<IIII")
+API_BASE = "https://pokeapi.co/api/v2/"
+API_MARKER = "/api/v2/"
+
+
+def url_key(url: str) -> Optional[str]:
+    """Maps a PokéAPI URL to its snapshot key ("…/api/v2/move/85/" -> "move/85")."""
+    i = url.find(API_MARKER)
+    if i < 0:
+        return None
+    return url[i + len(API_MARKER):].strip("/").lower()
+
+
+class Snapshot:
+    """Read-only, memory-mapped snapshot; lookups are a binary search over the index."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, _ = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a pkmon snapshot")
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key) is not None
+
+    def _entry(self, i: int):
+        return ENTRY.unpack_from(self._mm, HEADER.size + i * ENTRY.size)
+
+    def _find(self, key: str):
+        target = key.encode()
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            k_off, k_len, v_off, v_len = self._entry(mid)
+            k = self._mm[k_off:k_off + k_len]
+            if k < target:
+                lo = mid + 1
+            elif k > target:
+                hi = mid
+            else:
+                return v_off, v_len
+        return None
+
+    def get(self, key: str) -> Optional[dict]:
+        found = self._find(key.lower())
+        if found is None:
+            return None
+        v_off, v_len = found
+        return json.loads(zlib.decompress(self._mm[v_off:v_off + v_len]))
+
+    def get_url(self, url: str) -> Optional[dict]:
+        key = url_key(url)
+        return None if key is None else self.get(key)
+
+    def keys(self) -> Iterator[str]:
+        for i in range(self.count):
+            k_off, k_len, _, _ = self._entry(i)
+            yield self._mm[k_off:k_off + k_len].decode()
+
+
+def write_snapshot(records: Dict[str, dict], path: str) -> None:
+    """Writes records; keys that alias the same dict (id and name) share one value."""
+    keys = sorted(records)
+    index_end = HEADER.size + len(keys) * ENTRY.size
+    entries, blob = [], bytearray()
+    values: Dict[int, tuple] = {}
+    for key in keys:
+        k = key.encode()
+        k_off = index_end + len(blob)
+        blob += k
+        value = records[key]
+        if id(value) not in values:
+            v = zlib.compress(json.dumps(value, separators=(",", ":")).encode(), 6)
+            values[id(value)] = (index_end + len(blob), len(v))
+            blob += v
+        entries.append((k_off, len(k), *values[id(value)]))
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(keys), 0))
+        for e in entries:
+            f.write(ENTRY.pack(*e))
+        f.write(blob)
+    os.replace(tmp, path)
+
+
+def _read(csv_dir: str, name: str) -> List[dict]:
+    path = os.path.join(csv_dir, name)
+    if not os.path.exists(path):
+        return []
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _int(value: str) -> Optional[int]:
+    return int(value) if value not in ("", None) else None
+
+
+def build_records(csv_dir: str) -> Dict[str, dict]:
+    """Builds PokéAPI-shaped records (keyed by API path) from a CSV dump."""
+    def named(rows):
+        return {r["id"]: r["identifier"] for r in rows}
+
+    types = named(_read(csv_dir, "types.csv"))
+    stats = named(_read(csv_dir, "stats.csv"))
+    abilities = named(_read(csv_dir, "abilities.csv"))
+    damage_classes = named(_read(csv_dir, "move_damage_classes.csv"))
+    targets = named(_read(csv_dir, "move_targets.csv"))
+    languages = named(_read(csv_dir, "languages.csv"))
+    english = next((i for i, n in languages.items() if n == "en"), "9")
+    species_rows = _read(csv_dir, "pokemon_species.csv")
+    species_names = {r["id"]: r["identifier"] for r in species_rows}
+    move_rows = _read(csv_dir, "moves.csv")
+    move_names = {r["id"]: r["identifier"] for r in move_rows}
+
+    def ref(kind, id_, name):
+        return {"name": name, "url": f"{API_BASE}{kind}/{id_}/"}
+
+    records: Dict[str, dict] = {}
+
+    effects = {r["move_effect_id"]: r for r in _read(csv_dir, "move_effect_prose.csv")
+               if r["local_language_id"] == english}
+    stat_changes = defaultdict(list)
+    for r in _read(csv_dir, "move_meta_stat_changes.csv"):
+        stat_changes[r["move_id"]].append({
+            "change": int(r["change"]),
+            "stat": ref("stat", r["stat_id"], stats.get(r["stat_id"])),
+        })
+    for r in move_rows:
+        prose = effects.get(r["effect_id"])
+        move = {
+            "id": int(r["id"]),
+            "name": r["identifier"],
+            "type": ref("type", r["type_id"], types.get(r["type_id"])),
+            "power": _int(r["power"]),
+            "accuracy": _int(r["accuracy"]),
+            "pp": _int(r["pp"]),
+            "priority": _int(r["priority"]),
+            "effect_chance": _int(r["effect_chance"]),
+            "damage_class": ref("move-damage-class", r["damage_class_id"],
+                                damage_classes.get(r["damage_class_id"])),
+            "stat_changes": stat_changes.get(r["id"], []),
+            "target": ref("move-target", r["target_id"], targets.get(r["target_id"])),
+            "effect_entries": [{
+                "effect": prose["effect"],
+                "short_effect": prose["short_effect"],
+                "language": {"name": "en"},
+            }] if prose else [],
+        }
+        records[f"move/{r['id']}"] = move
+        records[f"move/{r['identifier']}"] = move
+
+    # Evolution chains: species grouped by chain, children ordered by species id
+    children = defaultdict(list)
+    chains = defaultdict(list)
+    for r in species_rows:
+        chains[r["evolution_chain_id"]].append(r)
+        if r["evolves_from_species_id"]:
+            children[r["evolves_from_species_id"]].append(r["id"])
+
+    def node(species_id):
+        return {
+            "species": ref("pokemon-species", species_id, species_names[species_id]),
+            "evolves_to": [node(c) for c in sorted(children[species_id], key=int)],
+        }
+
+    for chain_id, members in chains.items():
+        if not chain_id:
+            continue
+        ids = {m["id"] for m in members}
+        roots = sorted((m["id"] for m in members
+                        if m["evolves_from_species_id"] not in ids), key=int)
+        if roots:
+            records[f"evolution-chain/{chain_id}"] = {"id": int(chain_id), "chain": node(roots[0])}
+
+    for r in species_rows:
+        species = {
+            "id": int(r["id"]),
+            "name": r["identifier"],
+            "evolves_from_species": (ref("pokemon-species", r["evolves_from_species_id"],
+                                         species_names.get(r["evolves_from_species_id"]))
+                                     if r["evolves_from_species_id"] else None),
+        }
+        # PokéAPI always links a chain; leave the key out rather than writing null
+        if r["evolution_chain_id"]:
+            species["evolution_chain"] = {
+                "url": f"{API_BASE}evolution-chain/{r['evolution_chain_id']}/"}
+        records[f"pokemon-species/{r['id']}"] = species
+        records[f"pokemon-species/{r['identifier']}"] = species
+
+    poke_stats, poke_types, poke_abilities = defaultdict(list), defaultdict(list), defaultdict(list)
+    poke_moves = defaultdict(set)
+    for r in _read(csv_dir, "pokemon_stats.csv"):
+        poke_stats[r["pokemon_id"]].append((int(r["stat_id"]), {
+            "base_stat": int(r["base_stat"]), "effort": _int(r["effort"]),
+            "stat": ref("stat", r["stat_id"], stats.get(r["stat_id"])),
+        }))
+    for r in _read(csv_dir, "pokemon_types.csv"):
+        poke_types[r["pokemon_id"]].append({
+            "slot": int(r["slot"]), "type": ref("type", r["type_id"], types.get(r["type_id"])),
+        })
+    for r in _read(csv_dir, "pokemon_abilities.csv"):
+        poke_abilities[r["pokemon_id"]].append({
+            "slot": int(r["slot"]), "is_hidden": r["is_hidden"] == "1",
+            "ability": ref("ability", r["ability_id"], abilities.get(r["ability_id"])),
+        })
+    for r in _read(csv_dir, "pokemon_moves.csv"):
+        poke_moves[r["pokemon_id"]].add(int(r["move_id"]))
+
+    for r in _read(csv_dir, "pokemon.csv"):
+        pid = r["id"]
+        pokemon = {
+            "id": int(pid),
+            "name": r["identifier"],
+            "height": _int(r["height"]),
+            "weight": _int(r["weight"]),
+            "base_experience": _int(r.get("base_experience", "")),
+            "types": sorted(poke_types[pid], key=lambda t: t["slot"]),
+            "stats": [s for _, s in sorted(poke_stats[pid], key=lambda s: s[0])],
+            "abilities": sorted(poke_abilities[pid], key=lambda a: a["slot"]),
+            "moves": [{"move": ref("move", m, move_names[str(m)])}
+                      for m in sorted(poke_moves[pid]) if str(m) in move_names],
+            "species": ref("pokemon-species", r["species_id"], species_names.get(r["species_id"])),
+        }
+        records[f"pokemon/{pid}"] = pokemon
+        records[f"pokemon/{r['identifier']}"] = pokemon
+    return records
+
+
+def build_snapshot(csv_dir: str, path: str) -> int:
+    """Builds a snapshot file from a PokéAPI CSV dump; returns the record count."""
+    records = build_records(csv_dir)
+    write_snapshot(records, path)
+    return len(records)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build or query an offline PokéAPI snapshot.")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_build = sub.add_parser("build", help="import a PokéAPI CSV dump")
+    p_build.add_argument("csv_dir", help="e.g. pokeapi/data/v2/csv")
+    p_build.add_argument("out", help="snapshot file to write")
+    p_get = sub.add_parser("get", help="print one record")
+    p_get.add_argument("snapshot")
+    p_get.add_argument("key", help='API path, e.g. "pokemon/pikachu" or "move/85"')
+    args = parser.parse_args(argv)
+
+    if args.cmd == "build":
+        n = build_snapshot(args.csv_dir, args.out)
+        print(f"wrote {n} records to {args.out} ({os.path.getsize(args.out):,} bytes)")
+        return
+    record = Snapshot(args.snapshot).get(args.key)
+    if record is None:
+        raise SystemExit(f"{args.key} not found")
+    print(json.dumps(record, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import argparse
+import hashlib
+import json
+import random
+import sqlite3
+import time
+from typing import List, Optional, Tuple
+
+from pkmon_core.battle import ENGINE_VERSION, simulate
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS battlers (
+    hash TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS battles (
+    id INTEGER PRIMARY KEY,
+    a_hash TEXT NOT NULL REFERENCES battlers(hash),
+    b_hash TEXT NOT NULL REFERENCES battlers(hash),
+    seed INTEGER NOT NULL,
+    max_turns INTEGER NOT NULL,
+    engine TEXT NOT NULL,
+    winner TEXT NOT NULL,
+    turns INTEGER NOT NULL,
+    log_digest TEXT NOT NULL,
+    created REAL NOT NULL
+);
+"""
+
+
+def canonical(pokemon: dict) -> str:
+    """Stable JSON for the fields the engine reads (live "hp" is reset by `simulate`)."""
+    body = {k: pokemon[k] for k in ("name", "types", "stats", "moves")}
+    if pokemon.get("status"):
+        body["status"] = pokemon["status"]
+    return json.dumps(body, sort_keys=True, separators=(",", ":"))
+
+
+def battler_hash(pokemon: dict) -> str:
+    return hashlib.sha256(canonical(pokemon).encode()).hexdigest()
+
+
+def log_digest(log: List[str]) -> str:
+    return hashlib.sha256("\n".join(log).encode()).hexdigest()
+
+
+def count_turns(log: List[str]) -> int:
+    return sum(1 for line in log if line.startswith("--- Turn"))
+
+
+class BattleStore:
+    """Seed-only battle history in SQLite.
+
+    A battle row is just battler content hashes, seed, max_turns, engine
+    version, winner, turn count and a SHA-256 of the log; each distinct
+    battler is stored once. Since `simulate` is deterministic for those
+    inputs, `replay` regenerates the full log on demand and `verify` checks
+    it against the stored digest.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _put_battler(self, pokemon: dict) -> str:
+        data = canonical(pokemon)
+        h = hashlib.sha256(data.encode()).hexdigest()
+        self.conn.execute("INSERT OR IGNORE INTO battlers (hash, data) VALUES (?, ?)", (h, data))
+        return h
+
+    def _battler(self, h: str) -> dict:
+        row = self.conn.execute("SELECT data FROM battlers WHERE hash = ?", (h,)).fetchone()
+        if row is None:
+            raise KeyError(f"unknown battler {h}")
+        return json.loads(row[0])
+
+    def add(self, A: dict, B: dict, seed: int, max_turns: int, result: dict) -> int:
+        """Stores an already simulated battle; `seed` must be the one it ran with."""
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO battles (a_hash, b_hash, seed, max_turns, engine, winner,"
+                " turns, log_digest, created) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._put_battler(A), self._put_battler(B), seed, max_turns,
+                 ENGINE_VERSION, result["winner"], count_turns(result["log"]),
+                 log_digest(result["log"]), time.time()),
+            )
+        return cur.lastrowid
+
+    def record(self, A: dict, B: dict, seed: Optional[int] = None,
+               max_turns: int = 100) -> Tuple[int, dict]:
+        """Simulates a battle (picking a seed if none is given) and stores it."""
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 62)
+        result = simulate(A, B, seed=seed, max_turns=max_turns)
+        return self.add(A, B, seed, max_turns, result), result
+
+    def get(self, battle_id: int) -> dict:
+        cur = self.conn.execute("SELECT * FROM battles WHERE id = ?", (battle_id,))
+        row = cur.fetchone()
+        if row is None:
+            raise KeyError(f"unknown battle {battle_id}")
+        return dict(zip([c[0] for c in cur.description], row))
+
+    def ids(self) -> List[int]:
+        return [r[0] for r in self.conn.execute("SELECT id FROM battles ORDER BY id")]
+
+    def replay(self, battle_id: int) -> dict:
+        """Regenerates {"winner", "log"} for a stored battle."""
+        rec = self.get(battle_id)
+        if rec["engine"] != ENGINE_VERSION:
+            raise ValueError(f"battle {battle_id} was recorded with engine "
+                             f"{rec['engine']}, current engine is {ENGINE_VERSION}")
+        A, B = self._battler(rec["a_hash"]), self._battler(rec["b_hash"])
+        return simulate(A, B, seed=rec["seed"], max_turns=rec["max_turns"])
+
+    def verify(self, battle_id: int) -> bool:
+        """True if the replay reproduces the stored winner, turn count and log digest."""
+        rec = self.get(battle_id)
+        try:
+            result = self.replay(battle_id)
+        except ValueError:
+            return False
+        return (result["winner"] == rec["winner"]
+                and count_turns(result["log"]) == rec["turns"]
+                and log_digest(result["log"]) == rec["log_digest"])
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Replay or verify stored battles.")
+    parser.add_argument("db", help="SQLite battle store")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_replay = sub.add_parser("replay", help="print the regenerated log of a battle")
+    p_replay.add_argument("id", type=int)
+    p_verify = sub.add_parser("verify", help="check replays match (all battles by default)")
+    p_verify.add_argument("ids", type=int, nargs="*")
+    args = parser.parse_args(argv)
+
+    store = BattleStore(args.db)
+    if args.cmd == "replay":
+        result = store.replay(args.id)
+        print("Winner:", result["winner"])
+        print("\n".join(result["log"]))
+        return
+    ids = args.ids or store.ids()
+    bad = [i for i in ids if not store.verify(i)]
+    print(f"verified {len(ids) - len(bad)}/{len(ids)} battles")
+    if bad:
+        print("mismatched:", ", ".join(map(str, bad)))
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+import argparse
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pkmon_core.battle import ENGINE_VERSION
+from pkmon_core.kernel import run_battles
+from pkmon_core.registry import DEFAULT_ROSTER, Registry
+from pkmon_core.store import battler_hash
+
+_WORKER_REGISTRY: Optional[Registry] = None
+
+
+def _init_worker(registry: Registry) -> None:
+    global _WORKER_REGISTRY
+    _WORKER_REGISTRY = registry
+
+
+def win_rate(A: dict, B: dict, battles: int, max_turns: int) -> float:
+    """A's win fraction over `battles` seeded battles (draws count half).
+
+    Runs on the batch kernel, JIT-compiled when Numba is installed.
+    """
+    winners, _ = run_battles(A, B, range(battles), max_turns=max_turns)
+    score = sum(1.0 if w == 0 else 0.5 if w == -1 else 0.0 for w in winners)
+    return score / battles
+
+
+def win_rates(pairs: Sequence[Tuple[dict, dict]], battles: int, max_turns: int) -> List[float]:
+    """`win_rate` for each (A, B) pair; one job's worth of matrix cells."""
+    return [win_rate(A, B, battles, max_turns) for A, B in pairs]
+
+
+def _win_rate(args: Tuple[str, str, int, int]) -> float:
+    a, b, battles, max_turns = args
+    reg = _WORKER_REGISTRY
+    return win_rate(reg.battler(a), reg.battler(b), battles, max_turns)
+
+
+class MatchupMatrix:
+    """Cached pairwise win-rate matrix.
+
+    Cells are filled on demand (in parallel) and, if `cache_path` is set,
+    persisted as JSON so later runs only simulate new pairs. W(b, a) is
+    stored as 1 - W(a, b), so each unordered pair is simulated once. Rates
+    are keyed by battler content hash (`store.battler_hash`), so a changed
+    roster entry is re-simulated, and a cache file from another engine
+    version is ignored.
+    """
+
+    def __init__(self, registry: Registry, battles: int = 32, max_turns: int = 100,
+                 cache_path: Optional[str] = None):
+        self.registry = registry
+        self.battles = battles
+        self.max_turns = max_turns
+        self.cache_path = cache_path
+        self.rates: Dict[Tuple[str, str], float] = {}
+        if cache_path and os.path.exists(cache_path):
+            self._load()
+
+    def _load(self) -> None:
+        with open(self.cache_path) as f:
+            data = json.load(f)
+        if (data.get("engine") != ENGINE_VERSION or data.get("battles") != self.battles
+                or data.get("max_turns") != self.max_turns):
+            return
+        for a, b, p in data["rates"]:
+            self.rates[(a, b)] = p
+            self.rates[(b, a)] = 1.0 - p
+
+    def save(self) -> None:
+        if not self.cache_path:
+            return
+        rates = [[a, b, p] for (a, b), p in self.rates.items() if a <= b]
+        with open(self.cache_path, "w") as f:
+            json.dump({"engine": ENGINE_VERSION, "battles": self.battles,
+                       "max_turns": self.max_turns, "rates": rates}, f)
+
+    def hashes(self, names: Iterable[str]) -> Dict[str, str]:
+        return {n: battler_hash(self.registry.battler(n)) for n in set(names)}
+
+    def missing(self, rows: Iterable[str], cols: Iterable[str]) -> List[Tuple[str, str]]:
+        """Unordered name pairs still to simulate for the (row, col) cells; mirror matches are set to 0.5."""
+        rows, cols = list(rows), list(cols)
+        h = self.hashes(rows + cols)
+        missing = {}
+        for a in rows:
+            for b in cols:
+                ha, hb = h[a], h[b]
+                if (ha, hb) in self.rates:
+                    continue
+                if ha == hb:
+                    self.rates[(ha, hb)] = 0.5
+                elif ha < hb:
+                    missing[(ha, hb)] = (a, b)
+                else:
+                    missing[(hb, ha)] = (b, a)
+        return sorted(missing.values())
+
+    def fill(self, pairs: Sequence[Tuple[str, str]], results: Sequence[float]) -> None:
+        """Stores simulated win rates for `missing` pairs and saves the cache."""
+        h = self.hashes(n for pair in pairs for n in pair)
+        for (a, b), p in zip(pairs, results):
+            self.rates[(h[a], h[b])] = p
+            self.rates[(h[b], h[a])] = 1.0 - p
+        self.save()
+
+    def ensure(self, rows: Iterable[str], cols: Iterable[str],
+               workers: Optional[int] = None) -> int:
+        """Simulates every missing (row, col) cell; returns how many were filled."""
+        todo = self.missing(rows, cols)
+        if not todo:
+            return 0
+        args = [(a, b, self.battles, self.max_turns) for a, b in todo]
+        if workers == 1 or len(todo) < 8:
+            _init_worker(self.registry)
+            results = list(map(_win_rate, args))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self.registry,)) as pool:
+                chunk = max(1, len(args) // ((workers or os.cpu_count() or 1) * 4))
+                results = list(pool.map(_win_rate, args, chunksize=chunk))
+        self.fill(todo, results)
+        return len(todo)
+
+    def table(self, rows: Sequence[str], cols: Sequence[str]) -> List[List[float]]:
+        h = self.hashes(list(rows) + list(cols))
+        return [[self.rates[(h[a], h[b])] for b in cols] for a in rows]
+
+
+def team_score(team: Sequence[int], W: List[List[float]]) -> float:
+    """Mean over meta opponents of the team's best counter win rate."""
+    if not team:
+        return 0.0
+    cols = len(W[0])
+    return sum(max(W[t][m] for t in team) for m in range(cols)) / cols
+
+
+def optimize_team(W: List[List[float]], size: int = 6, iterations: int = 2000,
+                  seed: Optional[int] = None) -> Tuple[List[int], float]:
+    """Greedy build followed by simulated-annealing swaps.
+
+    W[i][m] is pool member i's win rate against meta opponent m. Returns
+    (pool indices, score).
+    """
+    n = len(W)
+    size = min(size, n)
+    if not W or not W[0] or size == 0:
+        return [], 0.0
+
+    team: List[int] = []
+    for _ in range(size):
+        best = max((i for i in range(n) if i not in team),
+                   key=lambda i: team_score(team + [i], W))
+        team.append(best)
+
+    rng = random.Random(seed)
+    score = team_score(team, W)
+    best_team, best_score = list(team), score
+    outside = [i for i in range(n) if i not in team]
+    temp = 0.05
+    for step in range(iterations if outside else 0):
+        t = temp * (1 - step / iterations) + 1e-6
+        ti, oi = rng.randrange(size), rng.randrange(len(outside))
+        cand = list(team)
+        cand[ti] = outside[oi]
+        cand_score = team_score(cand, W)
+        if cand_score >= score or rng.random() < math.exp((cand_score - score) / t):
+            outside[oi] = team[ti]
+            team, score = cand, cand_score
+            if score > best_score:
+                best_team, best_score = list(team), score
+    return best_team, best_score
+
+
+def load_battlers(names: Iterable[str], roster_path: Optional[str] = None,
+                  registry: Optional[Registry] = None) -> Registry:
+    """Fills a registry from a roster file, fetching anything missing from PokéAPI.
+
+    The roster is either a saved Registry (like the bundled
+    pkmon_core/data/roster.json) or a JSON list of battle-engine Pokémon dicts.
+    """
+    reg = registry if registry is not None else Registry()
+    if roster_path:
+        with open(roster_path) as f:
+            data = json.load(f)
+        roster = Registry.from_json(data) if isinstance(data, dict) else Registry.from_roster(data)
+        for name in roster.names():
+            reg.add_species(roster.battler(name))
+    missing = list(dict.fromkeys(n.lower() for n in names if n.lower() not in reg))
+    if missing:
+        from pkmon_core.pokeapi import battle_pokemon
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for pokemon in pool.map(battle_pokemon, missing):
+                reg.add_species(pokemon)
+    return reg
+
+
+def best_team(pool: Sequence[str], meta: Sequence[str], matrix: MatchupMatrix,
+              size: int = 6, iterations: int = 2000, seed: Optional[int] = None,
+              workers: Optional[int] = None) -> dict:
+    """Picks `size` members of `pool` that maximise expected wins against `meta`."""
+    pool = list(dict.fromkeys(n.lower() for n in pool))
+    meta = list(dict.fromkeys(n.lower() for n in meta))
+    matrix.ensure(pool, meta, workers=workers)
+    W = matrix.table(pool, meta)
+    team, score = optimize_team(W, size=size, iterations=iterations, seed=seed)
+    return {
+        "team": [pool[i] for i in team],
+        "expected_win_rate": round(score, 4),
+        "counters": {m: pool[max(team, key=lambda i: W[i][j])] for j, m in enumerate(meta)},
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Pick the team that best counters a meta.")
+    parser.add_argument("--pool", required=True, help="comma-separated candidate Pokémon")
+    parser.add_argument("--meta", required=True, help="comma-separated opponents")
+    parser.add_argument("--size", type=int, default=6)
+    parser.add_argument("--battles", type=int, default=32, help="battles per matchup")
+    parser.add_argument("--max-turns", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--roster", default=DEFAULT_ROSTER,
+                        help="saved Registry or JSON list of battle-engine Pokémon dicts "
+                             "(default: the bundled roster; pass '' to use only PokéAPI)")
+    parser.add_argument("--cache", default="matchups.json", help="win-rate cache file")
+    args = parser.parse_args(argv)
+
+    pool = [n.strip() for n in args.pool.split(",") if n.strip()]
+    meta = [n.strip() for n in args.meta.split(",") if n.strip()]
+    reg = load_battlers(pool + meta, args.roster)
+    matrix = MatchupMatrix(reg, battles=args.battles, max_turns=args.max_turns,
+                           cache_path=args.cache)
+    result = best_team(pool, meta, matrix, size=args.size, iterations=args.iterations,
+                       seed=args.seed, workers=args.workers)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
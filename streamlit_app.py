@@ -1,12 +1,10 @@
 import streamlit as st
-import json
-import requests
-from typing import Dict, List, Optional
-import time
-import random
-from tenacity import retry, wait_exponential, stop_after_attempt
-from pkmon_core.battle import simulate, TYPE_CHART
-from pkmon_core.server import fetch_pokemon_data, build_moves_with_effects
+from typing import List
+from pkmon_core.analytics import BattleRecorder, HIT
+from pkmon_core.battle import simulate
+from pkmon_core.montecarlo import WinRateRun
+from pkmon_core.pokeapi import fetch_pokemon_data, build_moves_with_effects
+from pkmon_core.registry import Registry, load_roster
 
 
 st.set_page_config(
@@ -76,261 +74,11 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-FALLBACK_POKEMON = {
-    "pikachu": {
-        "name": "pikachu",
-        "types": ["electric"],
-        "stats": {"hp": 35, "attack": 55, "defense": 40, "special-attack": 50, "special-defense": 50, "speed": 90},
-        "moves": [
-            {"name": "thunder-shock", "type": "electric", "power": 40},
-            {"name": "quick-attack", "type": "normal", "power": 40},
-            {"name": "thunderbolt", "type": "electric", "power": 90},
-            {"name": "iron-tail", "type": "steel", "power": 100}
-        ]
-    },
-    "charizard": {
-        "name": "charizard",
-        "types": ["fire", "flying"],
-        "stats": {"hp": 78, "attack": 84, "defense": 78, "special-attack": 109, "special-defense": 85, "speed": 100},
-        "moves": [
-            {"name": "flamethrower", "type": "fire", "power": 90},
-            {"name": "dragon-claw", "type": "dragon", "power": 80},
-            {"name": "air-slash", "type": "flying", "power": 75},
-            {"name": "fire-blast", "type": "fire", "power": 110}
-        ]
-    },
-    "blastoise": {
-        "name": "blastoise",
-        "types": ["water"],
-        "stats": {"hp": 79, "attack": 83, "defense": 100, "special-attack": 85, "special-defense": 105, "speed": 78},
-        "moves": [
-            {"name": "hydro-pump", "type": "water", "power": 110},
-            {"name": "ice-beam", "type": "ice", "power": 90},
-            {"name": "mega-punch", "type": "normal", "power": 80},
-            {"name": "surf", "type": "water", "power": 90}
-        ]
-    },
-    "venusaur": {
-        "name": "venusaur",
-        "types": ["grass", "poison"],
-        "stats": {"hp": 80, "attack": 82, "defense": 83, "special-attack": 100, "special-defense": 100, "speed": 80},
-        "moves": [
-            {"name": "razor-leaf", "type": "grass", "power": 55},
-            {"name": "sludge-bomb", "type": "poison", "power": 90},
-            {"name": "solar-beam", "type": "grass", "power": 120},
-            {"name": "earthquake", "type": "ground", "power": 100}
-        ]
-    },
-    "snorlax": {
-        "name": "snorlax",
-        "types": ["normal"],
-        "stats": {"hp": 160, "attack": 110, "defense": 65, "special-attack": 65, "special-defense": 110, "speed": 30},
-        "moves": [
-            {"name": "body-slam", "type": "normal", "power": 85},
-            {"name": "rest", "type": "psychic", "power": None},
-            {"name": "hyper-beam", "type": "normal", "power": 150},
-            {"name": "earthquake", "type": "ground", "power": 100}
-        ]
-    },
-    "mewtwo": {
-        "name": "mewtwo",
-        "types": ["psychic"],
-        "stats": {"hp": 106, "attack": 110, "defense": 90, "special-attack": 154, "special-defense": 90, "speed": 130},
-        "moves": [
-            {"name": "psychic", "type": "psychic", "power": 90},
-            {"name": "shadow-ball", "type": "ghost", "power": 80},
-            {"name": "thunderbolt", "type": "electric", "power": 90},
-            {"name": "ice-beam", "type": "ice", "power": 90}
-        ]
-    },
-    "mew": {
-        "name": "mew",
-        "types": ["psychic"],
-        "stats": {"hp": 100, "attack": 100, "defense": 100, "special-attack": 100, "special-defense": 100, "speed": 100},
-        "moves": [
-            {"name": "psychic", "type": "psychic", "power": 90},
-            {"name": "thunderbolt", "type": "electric", "power": 90},
-            {"name": "flamethrower", "type": "fire", "power": 90},
-            {"name": "ice-beam", "type": "ice", "power": 90}
-        ]
-    },
-    "lucario": {
-        "name": "lucario",
-        "types": ["fighting", "steel"],
-        "stats": {"hp": 70, "attack": 110, "defense": 70, "special-attack": 115, "special-defense": 70, "speed": 90},
-        "moves": [
-            {"name": "aura-sphere", "type": "fighting", "power": 80},
-            {"name": "close-combat", "type": "fighting", "power": 120},
-            {"name": "flash-cannon", "type": "steel", "power": 80},
-            {"name": "dragon-pulse", "type": "dragon", "power": 85}
-        ]
-    },
-    "garchomp": {
-        "name": "garchomp",
-        "types": ["dragon", "ground"],
-        "stats": {"hp": 108, "attack": 130, "defense": 95, "special-attack": 80, "special-defense": 85, "speed": 102},
-        "moves": [
-            {"name": "dragon-claw", "type": "dragon", "power": 80},
-            {"name": "earthquake", "type": "ground", "power": 100},
-            {"name": "stone-edge", "type": "rock", "power": 100},
-            {"name": "fire-blast", "type": "fire", "power": 110}
-        ]
-    },
-    "dragonite": {
-        "name": "dragonite",
-        "types": ["dragon", "flying"],
-        "stats": {"hp": 91, "attack": 134, "defense": 95, "special-attack": 100, "special-defense": 100, "speed": 80},
-        "moves": [
-            {"name": "dragon-claw", "type": "dragon", "power": 80},
-            {"name": "hurricane", "type": "flying", "power": 110},
-            {"name": "thunderbolt", "type": "electric", "power": 90},
-            {"name": "ice-beam", "type": "ice", "power": 90}
-        ]
-    },
-    "tyranitar": {
-        "name": "tyranitar",
-        "types": ["rock", "dark"],
-        "stats": {"hp": 100, "attack": 134, "defense": 110, "special-attack": 95, "special-defense": 100, "speed": 61},
-        "moves": [
-            {"name": "stone-edge", "type": "rock", "power": 100},
-            {"name": "crunch", "type": "dark", "power": 80},
-            {"name": "earthquake", "type": "ground", "power": 100},
-            {"name": "fire-blast", "type": "fire", "power": 110}
-        ]
-    },
-    "metagross": {
-        "name": "metagross",
-        "types": ["steel", "psychic"],
-        "stats": {"hp": 80, "attack": 135, "defense": 130, "special-attack": 95, "special-defense": 90, "speed": 70},
-        "moves": [
-            {"name": "meteor-mash", "type": "steel", "power": 90},
-            {"name": "psychic", "type": "psychic", "power": 90},
-            {"name": "earthquake", "type": "ground", "power": 100},
-            {"name": "thunder-punch", "type": "electric", "power": 75}
-        ]
-    },
-    "gengar": {
-        "name": "gengar",
-        "types": ["ghost", "poison"],
-        "stats": {"hp": 60, "attack": 65, "defense": 60, "special-attack": 130, "special-defense": 75, "speed": 110},
-        "moves": [
-            {"name": "shadow-ball", "type": "ghost", "power": 80},
-            {"name": "sludge-bomb", "type": "poison", "power": 90},
-            {"name": "thunderbolt", "type": "electric", "power": 90},
-            {"name": "psychic", "type": "psychic", "power": 90}
-        ]
-    },
-    "alakazam": {
-        "name": "alakazam",
-        "types": ["psychic"],
-        "stats": {"hp": 55, "attack": 50, "defense": 45, "special-attack": 135, "special-defense": 95, "speed": 120},
-        "moves": [
-            {"name": "psychic", "type": "psychic", "power": 90},
-            {"name": "shadow-ball", "type": "ghost", "power": 80},
-            {"name": "thunderbolt", "type": "electric", "power": 90},
-            {"name": "ice-beam", "type": "ice", "power": 90}
-        ]
-    },
-    "machamp": {
-        "name": "machamp",
-        "types": ["fighting"],
-        "stats": {"hp": 90, "attack": 130, "defense": 80, "special-attack": 65, "special-defense": 85, "speed": 55},
-        "moves": [
-            {"name": "close-combat", "type": "fighting", "power": 120},
-            {"name": "stone-edge", "type": "rock", "power": 100},
-            {"name": "earthquake", "type": "ground", "power": 100},
-            {"name": "thunder-punch", "type": "electric", "power": 75}
-        ]
-    },
-    "gyarados": {
-        "name": "gyarados",
-        "types": ["water", "flying"],
-        "stats": {"hp": 95, "attack": 125, "defense": 79, "special-attack": 60, "special-defense": 100, "speed": 81},
-        "moves": [
-            {"name": "waterfall", "type": "water", "power": 80},
-            {"name": "dragon-dance", "type": "dragon", "power": None},
-            {"name": "earthquake", "type": "ground", "power": 100},
-            {"name": "ice-fang", "type": "ice", "power": 65}
-        ]
-    },
-    "lapras": {
-        "name": "lapras",
-        "types": ["water", "ice"],
-        "stats": {"hp": 130, "attack": 85, "defense": 80, "special-attack": 85, "special-defense": 95, "speed": 60},
-        "moves": [
-            {"name": "surf", "type": "water", "power": 90},
-            {"name": "ice-beam", "type": "ice", "power": 90},
-            {"name": "thunderbolt", "type": "electric", "power": 90},
-            {"name": "psychic", "type": "psychic", "power": 90}
-        ]
-    },
-    "arcanine": {
-        "name": "arcanine",
-        "types": ["fire"],
-        "stats": {"hp": 90, "attack": 110, "defense": 80, "special-attack": 100, "special-defense": 80, "speed": 95},
-        "moves": [
-            {"name": "flamethrower", "type": "fire", "power": 90},
-            {"name": "thunder-fang", "type": "electric", "power": 65},
-            {"name": "crunch", "type": "dark", "power": 80},
-            {"name": "extreme-speed", "type": "normal", "power": 80}
-        ]
-    },
-    "ninetales": {
-        "name": "ninetales",
-        "types": ["fire"],
-        "stats": {"hp": 73, "attack": 76, "defense": 75, "special-attack": 81, "special-defense": 100, "speed": 100},
-        "moves": [
-            {"name": "flamethrower", "type": "fire", "power": 90},
-            {"name": "solar-beam", "type": "grass", "power": 120},
-            {"name": "psychic", "type": "psychic", "power": 90},
-            {"name": "shadow-ball", "type": "ghost", "power": 80}
-        ]
-    },
-    "raichu": {
-        "name": "raichu",
-        "types": ["electric"],
-        "stats": {"hp": 60, "attack": 90, "defense": 55, "special-attack": 90, "special-defense": 80, "speed": 110},
-        "moves": [
-            {"name": "thunderbolt", "type": "electric", "power": 90},
-            {"name": "brick-break", "type": "fighting", "power": 75},
-            {"name": "iron-tail", "type": "steel", "power": 100},
-            {"name": "quick-attack", "type": "normal", "power": 40}
-        ]
-    },
-    "machoke": {
-        "name": "machoke",
-        "types": ["fighting"],
-        "stats": {"hp": 80, "attack": 100, "defense": 70, "special-attack": 50, "special-defense": 60, "speed": 45},
-        "moves": [
-            {"name": "karate-chop", "type": "fighting", "power": 50},
-            {"name": "low-kick", "type": "fighting", "power": 60},
-            {"name": "seismic-toss", "type": "fighting", "power": 100},
-            {"name": "thunder-punch", "type": "electric", "power": 75}
-        ]
-    },
-    "haunter": {
-        "name": "haunter",
-        "types": ["ghost", "poison"],
-        "stats": {"hp": 45, "attack": 50, "defense": 45, "special-attack": 115, "special-defense": 55, "speed": 95},
-        "moves": [
-            {"name": "shadow-ball", "type": "ghost", "power": 80},
-            {"name": "sludge-bomb", "type": "poison", "power": 90},
-            {"name": "thunderbolt", "type": "electric", "power": 90},
-            {"name": "psychic", "type": "psychic", "power": 90}
-        ]
-    },
-    "kadabra": {
-        "name": "kadabra",
-        "types": ["psychic"],
-        "stats": {"hp": 40, "attack": 35, "defense": 30, "special-attack": 120, "special-defense": 70, "speed": 105},
-        "moves": [
-            {"name": "psychic", "type": "psychic", "power": 90},
-            {"name": "shadow-ball", "type": "ghost", "power": 80},
-            {"name": "thunderbolt", "type": "electric", "power": 90},
-            {"name": "ice-beam", "type": "ice", "power": 90}
-        ]
-    }
-}
+@st.cache_resource
+def fallback_registry() -> Registry:
+    """Bundled fallback roster (pkmon_core/data/roster.json), loaded once per server."""
+    return load_roster()
+
 
 def get_type_color(type_name: str) -> str:
     """Return a color for each Pokémon type"""
@@ -343,70 +91,72 @@ def get_type_color(type_name: str) -> str:
     }
     return colors.get(type_name.lower(), "#68A090")
 
-@retry(wait=wait_exponential(multiplier=1, min=2, max=10), stop=stop_after_attempt(3))
 def fetch_pokemon_with_retry(name: str) -> dict:
     """Fetch Pokémon data with retry logic and longer timeout."""
     try:
-       
-        session = requests.Session()
-        session.timeout = 30 
-        url = f"https://pokeapi.co/api/v2/pokemon/{name.lower()}"
-        response = session.get(url, timeout=30)
-        if response.status_code != 200:
-            raise ValueError(f"Could not fetch data for {name}")
-        return response.json()
+        return fetch_pokemon_data(name, timeout=30)
     except Exception as e:
         st.warning(f"API fetch failed for {name}: {str(e)}. Using fallback data...")
         raise e
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def api_pokemon(name: str) -> dict:
+    """Builds a battle-engine Pokémon from PokéAPI.
+
+    Cached per name so widget reruns don't refetch. Fetch errors propagate,
+    and Streamlit doesn't cache exceptions, so a failed fetch is retried on
+    the next call.
+    """
+    data = fetch_pokemon_with_retry(name)
+    moves = build_moves_with_effects(data, limit=8)
+    raw = {s["stat"]["name"]: s["base_stat"] for s in data["stats"]}
+    stats = {
+        "hp": raw.get("hp", 50),
+        "attack": raw.get("attack", 50),
+        "defense": raw.get("defense", 50),
+        "special-attack": raw.get("special-attack", raw.get("sp-attack", 50)),
+        "special-defense": raw.get("special-defense", raw.get("sp-defense", 50)),
+        "speed": raw.get("speed", 50),
+    }
+    return {
+        "name": data["name"],
+        "types": [t["type"]["name"] for t in data["types"]],
+        "stats": stats,
+        "moves": moves,
+    }
+
+def similar_fallback(name: str) -> dict:
+    """Closest fallback roster entry by name, or Pikachu."""
+    fallback = fallback_registry()
+    for fallback_name in fallback.names():
+        if name.lower() in fallback_name or fallback_name in name.lower():
+            st.info(f"Using similar fallback data ({fallback_name}) for {name}")
+            return fallback.battler(fallback_name)
+    st.warning(f"No fallback data available for {name}. Using Pikachu as default.")
+    return fallback.battler("pikachu")
+
 def battle_pokemon(name: str, use_fallback_only: bool = False) -> dict:
-    """Builds a Pokémon object suitable for the battle engine from PokéAPI with fallback."""
-    
-    if name.lower() in FALLBACK_POKEMON:
-        fallback_data = FALLBACK_POKEMON[name.lower()].copy()
+    """Builds a Pokémon object suitable for the battle engine from PokéAPI with fallback.
+
+    Only API results are cached (see `api_pokemon`); a fallback stand-in is
+    picked per call, so a transient API failure doesn't stick for an hour.
+    """
+    fallback = fallback_registry()
+
+    if name.lower() in fallback:
+        fallback_data = fallback.battler(name)
         if use_fallback_only:
             st.info(f"Using fallback data for {name.title()}")
         return fallback_data
-    
-   
+
     if use_fallback_only:
-        for fallback_name, fallback_data in FALLBACK_POKEMON.items():
-            if name.lower() in fallback_name or fallback_name in name.lower():
-                st.info(f"Using similar fallback data ({fallback_name}) for {name}")
-                return fallback_data.copy()
-        st.warning(f"No fallback data available for {name}. Using Pikachu as default.")
-        return FALLBACK_POKEMON["pikachu"].copy()
-    
-    
+        return similar_fallback(name)
+
     try:
-        data = fetch_pokemon_with_retry(name)
-        moves = build_moves_with_effects(data, limit=8)
-        raw = {s["stat"]["name"]: s["base_stat"] for s in data["stats"]}
-        stats = {
-            "hp": raw.get("hp", 50),
-            "attack": raw.get("attack", 50),
-            "defense": raw.get("defense", 50),
-            "special-attack": raw.get("special-attack", raw.get("sp-attack", 50)),
-            "special-defense": raw.get("special-defense", raw.get("sp-defense", 50)),
-            "speed": raw.get("speed", 50),
-        }
-        return {
-            "name": data["name"],
-            "types": [t["type"]["name"] for t in data["types"]],
-            "stats": stats,
-            "moves": moves,
-        }
+        return api_pokemon(name)
     except Exception as e:
         st.warning(f"Failed to fetch {name} from API: {str(e)}")
-        
-        for fallback_name, fallback_data in FALLBACK_POKEMON.items():
-            if name.lower() in fallback_name or fallback_name in name.lower():
-                st.info(f"Using similar fallback data ({fallback_name}) for {name}")
-                return fallback_data.copy()
-        
-        
-        st.warning(f"No fallback data available for {name}. Using Pikachu as default.")
-        return FALLBACK_POKEMON["pikachu"].copy()
+        return similar_fallback(name)
 
 def pokemon_card(pokemon: dict, title: str):
     """Display a Pokémon card with stats and info"""
@@ -444,25 +194,113 @@ def pokemon_card(pokemon: dict, title: str):
         moves_text = ", ".join([move['name'].replace('-', ' ').title() for move in pokemon['moves'][:4]])
         st.markdown(f"*{moves_text}*")
 
+TURNS_PER_PAGE = 10
+
+def split_turns(log: List[str]) -> List[List[str]]:
+    """Groups log lines by turn in a single pass."""
+    turns: List[List[str]] = []
+    for line in log:
+        if line.startswith("--- Turn") or not turns:
+            turns.append([])
+        turns[-1].append(line)
+    return turns
+
+def format_log_line(line: str) -> str:
+    if "Turn" in line:
+        return f"<div style='color: #FFD700; font-weight: bold; margin: 10px 0;'>{line}</div>"
+    if "fainted" in line.lower():
+        return f"<div style='color: #FF6B6B; font-weight: bold;'>{line}</div>"
+    if "used" in line:
+        return f"<div style='color: #4ECDC4;'>{line}</div>"
+    if line.endswith(("rose!", "rose sharply!", "fell!", "fell sharply!", "any higher!", "any lower!")):
+        return f"<div style='color: #B19CD9;'>{line}</div>"
+    if "hurt by" in line.lower() or "affected by" in line.lower():
+        return f"<div style='color: #FFA07A;'>{line}</div>"
+    return f"<div>{line}</div>"
+
 def battle_log(log: List[str]):
-    """Display the battle log with proper formatting"""
+    """Display the battle log, one page of turns at a time"""
+    turns = split_turns(log)
+    pages = max(1, -(-len(turns) // TURNS_PER_PAGE))
     with st.container():
         st.markdown("### Battle Log")
-        log_html = "<div class='battle-log'>"
-        for line in log:
-            if "Turn" in line:
-                log_html += f"<div style='color: #FFD700; font-weight: bold; margin: 10px 0;'>{line}</div>"
-            elif "fainted" in line.lower():
-                log_html += f"<div style='color: #FF6B6B; font-weight: bold;'>{line}</div>"
-            elif "used" in line and "→" in line:
-                log_html += f"<div style='color: #4ECDC4;'>{line}</div>"
-            elif "hurt by" in line.lower() or "affected by" in line.lower():
-                log_html += f"<div style='color: #FFA07A;'>{line}</div>"
-            else:
-                log_html += f"<div>{line}</div>"
-        log_html += "</div>"
-        st.markdown(log_html, unsafe_allow_html=True)
+        page = 1
+        if pages > 1:
+            page = st.number_input(f"Page (of {pages}, {TURNS_PER_PAGE} turns each):",
+                                   min_value=1, max_value=pages, value=1, key="log_page")
+        visible = turns[(page - 1) * TURNS_PER_PAGE:page * TURNS_PER_PAGE]
+        log_html = "".join(format_log_line(line) for turn in visible for line in turn)
+        st.markdown(f"<div class='battle-log'>{log_html}</div>", unsafe_allow_html=True)
+
+def battle_stats(recorder: BattleRecorder) -> dict:
+    """Turn / move / status counts from the engine's structured records."""
+    moves_used = status_effects = 0
+    for kind, status in zip(recorder.events["kind"], recorder.events["status"]):
+        if kind == HIT:
+            moves_used += 1
+            if status:
+                status_effects += 1
+    return {"turns": recorder.battles["turns"][0], "moves_used": moves_used,
+            "status_effects": status_effects}
+
+def cancel_win_rate_run():
+    run = st.session_state.pop("mc_run", None)
+    if run is not None:
+        run.cancel()
+    st.session_state.pop("mc_key", None)
+
+def win_rate_panel():
+    """Live view of the background Monte Carlo run in session state"""
+    run = st.session_state.get("mc_run")
+    if run is None:
+        return
+    snap = run.snapshot()
+    name_a, name_b = run.A["name"].title(), run.B["name"].title()
+
+    if snap["error"]:
+        st.error(f"Simulation failed: {snap['error']}")
+        return
+    st.progress(snap["battles"] / snap["target"],
+                text=f"{snap['battles']:,} / {snap['target']:,} battles")
+    if not snap["battles"]:
+        return
+
+    low, high = snap["ci"]
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(f"{name_a} Win Probability", f"{snap['win_rate_a']:.1%}")
+        st.caption(f"95% CI: {low:.1%} – {high:.1%}")
+    with col2:
+        st.metric(f"{name_a} / {name_b} Wins", f"{snap['wins_a']:,} / {snap['wins_b']:,}")
+    with col3:
+        st.metric("Draws", f"{snap['draws']:,}")
+
+    st.markdown("**Battle Length (turns)**")
+    st.bar_chart({"turns": list(snap["turns"]), "battles": list(snap["turns"].values())},
+                 x="turns", y="battles")
+
+    if snap["done"] and st.session_state.get("mc_refreshing"):
+        # Final full rerun so the panel stops polling
+        st.session_state["mc_refreshing"] = False
+        st.rerun()
+
+def win_probability(pokemon1_name: str, pokemon2_name: str, max_turns: int, seed: int,
+                    use_fallback: bool, battles: int):
+    """Starts (or keeps) a background run for the current selection and shows it"""
+    key = (pokemon1_name, pokemon2_name, max_turns, seed, use_fallback, battles)
+    if st.session_state.get("mc_key") != key:
+        cancel_win_rate_run()
+        with st.spinner("Loading Pokémon..."):
+            pokemon1 = battle_pokemon(pokemon1_name, use_fallback_only=use_fallback)
+            pokemon2 = battle_pokemon(pokemon2_name, use_fallback_only=use_fallback)
+        st.session_state["mc_run"] = WinRateRun(pokemon1, pokemon2, battles=battles,
+                                                max_turns=max_turns, seed=seed).start()
+        st.session_state["mc_key"] = key
 
+    st.markdown(f"### 🎲 Win Probability: {pokemon1_name.title()} vs {pokemon2_name.title()}")
+    running = not st.session_state["mc_run"].done
+    st.session_state["mc_refreshing"] = running
+    st.fragment(win_rate_panel, run_every=0.5 if running else None)()
 
 
 def main():
@@ -480,6 +318,8 @@ def main():
             "arcanine", "ninetales", "raichu", "machoke", "haunter", "kadabra"
         ]
         
+        mode = st.radio("Mode:", ["Single Battle", "Win Probability"], horizontal=True)
+
         st.subheader("Select Pokémon")
         pokemon1_name = st.selectbox("Pokémon 1:", popular_pokemon, index=0)
         pokemon2_name = st.selectbox("Pokémon 2:", popular_pokemon, index=2)
@@ -496,70 +336,72 @@ def main():
         use_fallback = st.checkbox("Use Fallback Data Only", value=False, 
                                  help="Check this if you're experiencing API timeout issues")
 
-        battle_button = st.button("⚔️ START BATTLE!", type="primary", use_container_width=True)
-    
+        if mode == "Win Probability":
+            n_battles = st.slider("Battles:", 500, 10000, 2000, step=500)
+        else:
+            battle_button = st.button("⚔️ START BATTLE!", type="primary", use_container_width=True)
+
+    if mode == "Win Probability":
+        win_probability(pokemon1_name, pokemon2_name, max_turns, seed or 0,
+                        use_fallback, n_battles)
+        st.markdown("---")
+        return
+    cancel_win_rate_run()
 
     if battle_button:
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+        with st.spinner("Loading Pokémon..."):
+            pokemon1 = battle_pokemon(pokemon1_name, use_fallback_only=use_fallback)
+            pokemon2 = battle_pokemon(pokemon2_name, use_fallback_only=use_fallback)
 
-        status_text.text("Loading Pokémon 1..")
-        progress_bar.progress(25)
-        pokemon1 = battle_pokemon(pokemon1_name, use_fallback_only=use_fallback)
-        
-        status_text.text("Loading Pokémon 2...")
-        progress_bar.progress(50)
-        pokemon2 = battle_pokemon(pokemon2_name, use_fallback_only=use_fallback)
-        
-        status_text.text("Preparing battle..")
-        progress_bar.progress(75)
-        
         if pokemon1 and pokemon2:
-       
-            progress_bar.progress(100)
-            status_text.text("Battle ready!")
-            time.sleep(0.5) 
-            progress_bar.empty()
-            status_text.empty()
+            recorder = BattleRecorder()
+            with st.spinner("Simulating battle..."):
+                result = simulate(pokemon1, pokemon2, seed=seed, max_turns=max_turns,
+                                  recorder=recorder)
+            # Kept in session state so paging the log doesn't re-run the battle
+            st.session_state["battle"] = {
+                "pokemon1": pokemon1, "pokemon2": pokemon2,
+                "result": result, "stats": battle_stats(recorder),
+            }
+            st.session_state.pop("log_page", None)
+        else:
+            st.session_state.pop("battle", None)
+            st.error("Failed to load one or both Pokémon. Please try again.")
 
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                pokemon_card(pokemon1, "Pokémon 1")
-            
-            with col2:
-                pokemon_card(pokemon2, "Pokémon 2")
+    battle = st.session_state.get("battle")
+    if battle:
+        col1, col2 = st.columns(2)
 
-            st.markdown("---")
-            st.markdown("### ⚔️ Battle Simulation")
-            
-            with st.spinner("Simulating battle..."):
-                result = simulate(pokemon1, pokemon2, seed=seed, max_turns=max_turns)
-            
-            winner = result["winner"]
-            if winner != "Draw":
-                st.markdown(f'<div class="winner-announcement">🏆 {winner.title()} Wins! 🏆</div>', 
-                           unsafe_allow_html=True)
-            else:
-                st.markdown('<div class="winner-announcement">🤝 It\'s a Draw! 🤝</div>', 
-                           unsafe_allow_html=True)
-            battle_log(result["log"])
+        with col1:
+            pokemon_card(battle["pokemon1"], "Pokémon 1")
 
-            st.markdown("### 📊 Battle Statistics")
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("Total Turns", len([line for line in result["log"] if "Turn" in line]))
-            
-            with col2:
-                moves_used = len([line for line in result["log"] if "used" in line])
-                st.metric("Moves Used", moves_used)
-            
-            with col3:
-                status_effects = len([line for line in result["log"] if "affected by" in line])
-                st.metric("Status Effects", status_effects)
+        with col2:
+            pokemon_card(battle["pokemon2"], "Pokémon 2")
+
+        st.markdown("---")
+        st.markdown("### ⚔️ Battle Simulation")
+
+        winner = battle["result"]["winner"]
+        if winner != "Draw":
+            st.markdown(f'<div class="winner-announcement">🏆 {winner.title()} Wins! 🏆</div>', 
+                       unsafe_allow_html=True)
         else:
-            st.error("Failed to load one or both Pokémon. Please try again.")
+            st.markdown('<div class="winner-announcement">🤝 It\'s a Draw! 🤝</div>', 
+                       unsafe_allow_html=True)
+        battle_log(battle["result"]["log"])
+
+        st.markdown("### 📊 Battle Statistics")
+        stats = battle["stats"]
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("Total Turns", stats["turns"])
+
+        with col2:
+            st.metric("Moves Used", stats["moves_used"])
+
+        with col3:
+            st.metric("Status Effects", stats["status_effects"])
 
     st.markdown("---")
    
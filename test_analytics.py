@@ -0,0 +1,84 @@
+import pytest
+
+import pkmon_core.battle as battle
+from pkmon_core.analytics import BattleRecorder, HIT, STATUS_DAMAGE, PARALYZED
+
+
+A = {
+    "name": "pikachu",
+    "types": ["electric"],
+    "stats": {"hp": 35, "attack": 55, "defense": 40, "special-attack": 50,
+              "special-defense": 50, "speed": 90},
+    "moves": [
+        {"name": "thunderbolt", "type": "electric", "power": 90},
+        {"name": "quick-attack", "type": "normal", "power": 40},
+    ],
+}
+
+B = {
+    "name": "charizard",
+    "types": ["fire", "flying"],
+    "stats": {"hp": 78, "attack": 84, "defense": 78, "special-attack": 109,
+              "special-defense": 85, "speed": 100},
+    "moves": [
+        {"name": "flamethrower", "type": "fire", "power": 90},
+        {"name": "air-slash", "type": "flying", "power": 75},
+    ],
+}
+
+
+def test_recorder_matches_log():
+    rec = BattleRecorder()
+    for seed in range(20):
+        result = battle.simulate(A, B, seed=seed, recorder=rec)
+        log = result["log"]
+        i = len(rec) - 1
+        b = rec.battles
+        assert b["turns"][i] == sum(1 for line in log if "Turn" in line)
+        assert b["seed"][i] == seed
+        winner = {0: "pikachu", 1: "charizard", -1: "Draw"}[b["winner"][i]]
+        assert winner == result["winner"]
+
+        kinds = [k for bid, k in zip(rec.events["battle_id"], rec.events["kind"]) if bid == i]
+        assert kinds.count(HIT) == sum(1 for line in log if " used " in line)
+        assert kinds.count(STATUS_DAMAGE) == sum(1 for line in log if "hurt by" in line)
+        assert kinds.count(PARALYZED) == sum(1 for line in log if "paralyzed" in line)
+
+    assert len(rec) == 20
+    assert rec.names[rec.battles["pokemon_a"][0]] == "pikachu"
+
+
+def recorded(n=50):
+    rec = BattleRecorder()
+    for seed in range(n):
+        battle.simulate(A, B, seed=seed, recorder=rec)
+    return rec
+
+
+def test_to_numpy():
+    np = pytest.importorskip("numpy")
+    rec = recorded()
+    views = rec.to_numpy()
+    assert views["battles"]["winner"].dtype == np.int8
+    assert views["battles"]["turns"].tolist() == rec.battles["turns"].tolist()
+    assert views["events"]["damage"].sum() == sum(rec.events["damage"])
+
+
+def test_arrow_exports(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    rec = recorded()
+    tables = rec.to_arrow()
+    events = tables["events"]
+    assert events.num_rows == len(rec.events["battle_id"])
+    moves = events.column("move").to_pylist()
+    assert moves == [None if m < 0 else rec.names[m] for m in rec.events["move"]]
+    assert tables["battles"].column("pokemon_a").to_pylist()[0] == "pikachu"
+
+    battles_path, events_path = rec.write_parquet(str(tmp_path / "run"))
+    assert pq.read_table(events_path).column("move").to_pylist() == moves
+    assert pq.read_table(battles_path).num_rows == len(rec)
+
+    battles_path, events_path = rec.write_ipc(str(tmp_path / "run"))
+    with pa.memory_map(events_path) as source:
+        assert pa.ipc.open_file(source).read_all().equals(events)
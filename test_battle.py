@@ -1,6 +1,8 @@
  # make a new file test_battle.py
  
 import pkmon_core.battle as battle
+from pkmon_core.kernel import run_battles
+from pkmon_core.registry import load_roster
 
 
 A = {
@@ -44,3 +46,50 @@ result = battle.simulate(A, B, seed=42)
 
 print("Winner:", result["winner"])
 print("\n".join(result["log"][:50]))
+
+
+ROSTER = load_roster()
+
+
+def test_special_moves_use_special_stats():
+    alakazam, machamp = ROSTER.battler("alakazam"), ROSTER.battler("machamp")
+    move = {"name": "psychic", "type": "psychic", "power": 90}
+    physical = battle.damage(alakazam, machamp, dict(move, damage_class="physical"))
+    special = battle.damage(alakazam, machamp, dict(move, damage_class="special"))
+    assert special > physical
+    # Stages scale the stat: +2 doubles it
+    boosted = dict(alakazam, stages={"special-attack": 2})
+    assert battle.damage(boosted, machamp, dict(move, damage_class="special")) > special
+
+
+def test_simulate_uses_special_stats():
+    alakazam, machamp = ROSTER.battler("alakazam"), ROSTER.battler("machamp")
+    psychic = next(m for m in alakazam["moves"] if m["name"] == "psychic")
+    assert psychic["damage_class"] == "special"
+    result = battle.simulate(dict(alakazam, moves=[psychic]), machamp, seed=0, max_turns=1)
+    # alakazam is faster; 2x vs fighting, special-attack 135 vs special-defense 85
+    expected = int((((2 * 50 / 5 + 2) * 90 * 135 / 85) / 50 + 2) * 2.0)
+    assert f"alakazam used psychic → machamp lost {expected} HP!" in result["log"]
+    physical = int((((2 * 50 / 5 + 2) * 90 * 50 / 80) / 50 + 2) * 2.0)
+    assert expected != physical
+
+
+def test_dragon_dance_raises_stages():
+    gyarados, snorlax = ROSTER.battler("gyarados"), ROSTER.battler("snorlax")
+    dance = next(m for m in gyarados["moves"] if m["name"] == "dragon-dance")
+    assert battle.damage(gyarados, snorlax, dance) == 0
+    result = battle.simulate(dict(gyarados, moves=[dance]), snorlax, seed=0, max_turns=7)
+    assert "gyarados used dragon-dance!" in result["log"]
+    assert "gyarados's attack rose!" in result["log"]
+    assert "gyarados's speed won't go any higher!" in result["log"]
+
+
+def test_stat_changes_without_target_hit_the_opponent():
+    gyarados, snorlax = ROSTER.battler("gyarados"), ROSTER.battler("snorlax")
+    growl = {"name": "growl", "type": "normal", "power": None, "damage_class": "status",
+             "stat_changes": {"attack": -1}, "target": None}
+    result = battle.simulate(dict(gyarados, moves=[growl]), snorlax, seed=0, max_turns=1)
+    assert "snorlax's attack fell!" in result["log"]
+    winners, _ = run_battles(dict(gyarados, moves=[growl]), snorlax, [0], max_turns=1,
+                             use_jit=False)
+    assert winners[0] == 1
@@ -0,0 +1,70 @@
+import math
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from pkmon_core.battle import simulate
+from pkmon_core.kernel import backend, run_battles
+from pkmon_core.registry import load_roster
+
+ROSTER = load_roster()
+
+
+def outcome_stats(winners, turns):
+    n = len(winners)
+    return (sum(1 for w in winners if w == 0) / n,
+            sum(1 for w in winners if w == -1) / n,
+            sum(turns) / n)
+
+
+def simulate_stats(A, B, n, max_turns):
+    winners, turns = [], []
+    for seed in range(n):
+        result = simulate(A, B, seed=seed, max_turns=max_turns)
+        winners.append(0 if result["winner"] == A["name"] else
+                       1 if result["winner"] == B["name"] else -1)
+        turns.append(sum(1 for line in result["log"] if line.startswith("--- Turn")))
+    return outcome_stats(winners, turns)
+
+
+def test_deterministic_battle_matches_exactly():
+    # One move each and no status moves: no randomness left in the battle
+    venusaur, blastoise = ROSTER.battler("venusaur"), ROSTER.battler("blastoise")
+    A = dict(venusaur, moves=[venusaur["moves"][0]])
+    B = dict(blastoise, moves=[blastoise["moves"][2]])
+    result = simulate(A, B, seed=0)
+    winners, turns = run_battles(A, B, [0], use_jit=False)
+    assert winners[0] == (0 if result["winner"] == A["name"] else 1)
+    assert turns[0] == sum(1 for line in result["log"] if line.startswith("--- Turn"))
+
+
+def test_outcome_distributions_match_simulate():
+    n = 4000
+    # Close matchups with paralysis / burn / poison moves, special moves and
+    # status moves (dragon-dance, rest); max_turns=1 ends on HP
+    for a, b, max_turns in (("charizard", "metagross", 100), ("blastoise", "gengar", 100),
+                            ("gyarados", "snorlax", 100), ("charizard", "gyarados", 1)):
+        A, B = ROSTER.battler(a), ROSTER.battler(b)
+        use_jit = [False] + ([True] if backend() == "numba" else [])
+        expected = simulate_stats(A, B, n, max_turns)
+        for jit in use_jit:
+            got = outcome_stats(*run_battles(A, B, range(10 ** 6, 10 ** 6 + n),
+                                             max_turns=max_turns, use_jit=jit))
+            for p, q in zip(expected[:2], got[:2]):
+                # two-sample difference of proportions, ~5 sigma
+                assert abs(p - q) <= 5 * math.sqrt(2 * max(p * (1 - p), 1 / n) / n) + 1e-9
+            assert abs(expected[2] - got[2]) <= 0.05 * expected[2] + 0.1
+
+
+def test_python_kernel_is_thread_safe_and_leaves_global_random_alone():
+    A, B = ROSTER.battler("charizard"), ROSTER.battler("metagross")
+    expected = run_battles(A, B, range(2000), use_jit=False)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: run_battles(A, B, range(2000), use_jit=False),
+                                range(4)))
+    assert all(r == expected for r in results)
+
+    random.seed(123)
+    run_battles(A, B, range(10), use_jit=False)
+    after = random.random()
+    random.seed(123)
+    assert random.random() == after
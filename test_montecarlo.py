@@ -0,0 +1,36 @@
+import time
+
+from pkmon_core.kernel import run_battles
+from pkmon_core.montecarlo import WinRateRun, wilson_interval
+from pkmon_core.registry import load_roster
+
+ROSTER = load_roster()
+A, B = ROSTER.battler("pikachu"), ROSTER.battler("charizard")
+
+
+def test_run_matches_kernel():
+    run = WinRateRun(A, B, battles=200, max_turns=50, seed=10).start()
+    while not run.done:
+        time.sleep(0.01)
+    snap = run.snapshot()
+
+    winners, _ = run_battles(A, B, range(10, 210), max_turns=50)
+    wins_a = sum(1 for w in winners if w == 0)
+    assert snap["battles"] == 200
+    assert snap["wins_a"] == wins_a
+    assert sum(snap["turns"].values()) == 200
+    low, high = snap["ci"]
+    assert low <= snap["win_rate_a"] <= high
+
+
+def test_cancel_stops_worker():
+    run = WinRateRun(A, B, battles=10 ** 6).start()
+    run.cancel()
+    run._thread.join(timeout=5)
+    assert run.done and run.snapshot()["battles"] < 10 ** 6
+
+
+def test_wilson_interval():
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    low, high = wilson_interval(50, 100)
+    assert abs((low + high) / 2 - 0.5) < 1e-9 and high - low < 0.2
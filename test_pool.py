@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+from pkmon_core.battle import simulate
+from pkmon_core.pool import ServerBusy, SimulationPool
+from pkmon_core.registry import load_roster
+
+ROSTER = load_roster()
+A, B = ROSTER.battler("pikachu"), ROSTER.battler("charizard")
+
+
+def test_pool_matches_direct_simulation():
+    pool = SimulationPool(workers=2)
+    try:
+        result = asyncio.run(pool.run(simulate, A, B, seed=7, max_turns=50))
+    finally:
+        pool.shutdown()
+    assert result == simulate(A, B, seed=7, max_turns=50)
+
+
+def test_pool_sheds_load_when_full():
+    pool = SimulationPool(workers=1, max_pending=1, queue_timeout=0.1)
+
+    async def main():
+        return await asyncio.gather(pool.run(time.sleep, 0.5), pool.run(time.sleep, 0.5),
+                                    return_exceptions=True)
+    try:
+        results = asyncio.run(main())
+    finally:
+        pool.shutdown()
+    assert sum(isinstance(r, ServerBusy) for r in results) == 1
+
+
+def test_timed_out_job_keeps_its_slot():
+    pool = SimulationPool(workers=1, max_pending=1, timeout=0.1, queue_timeout=0.1)
+
+    async def main():
+        first = await asyncio.gather(pool.run(time.sleep, 0.6), return_exceptions=True)
+        # The worker is still sleeping, so the slot is still taken
+        second = await asyncio.gather(pool.run(time.sleep, 0), return_exceptions=True)
+        await asyncio.sleep(0.8)
+        third = await pool.run(abs, -3)
+        return first[0], second[0], third
+    try:
+        first, second, third = asyncio.run(main())
+    finally:
+        pool.shutdown()
+    assert isinstance(first, asyncio.TimeoutError)
+    assert isinstance(second, ServerBusy)
+    assert third == 3
@@ -0,0 +1,56 @@
+import pickle
+
+from pkmon_core.registry import Registry, load_roster
+
+
+ROSTER = [
+    {
+        "name": "mew",
+        "types": ["psychic"],
+        "stats": {"hp": 100, "attack": 100, "defense": 100, "special-attack": 100,
+                  "special-defense": 100, "speed": 100},
+        "moves": [
+            {"name": "psychic", "type": "psychic", "power": 90},
+            {"name": "ice-beam", "type": "ice", "power": 90},
+        ],
+    },
+    {
+        "name": "lapras",
+        "types": ["water", "ice"],
+        "stats": {"hp": 130, "attack": 85, "defense": 80, "special-attack": 85,
+                  "special-defense": 95, "speed": 60},
+        "moves": [
+            {"name": "surf", "type": "water", "power": 90},
+            {"name": "ice-beam", "type": "ice", "power": 90},
+        ],
+    },
+]
+
+
+def test_moves_are_shared():
+    reg = Registry.from_roster(ROSTER)
+    assert len(reg) == 2
+    assert len(reg.moves) == 3
+    mew, lapras = reg.battler("mew"), reg.battler("Lapras")
+    assert mew["moves"][1] is lapras["moves"][1]
+    assert mew == ROSTER[0]
+
+
+def test_pickle_roundtrip():
+    reg = pickle.loads(pickle.dumps(Registry.from_roster(ROSTER)))
+    assert reg.battler(reg.species_id("lapras")) == ROSTER[1]
+    assert "mew" in reg
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "roster.json")
+    Registry.from_roster(ROSTER).save(path)
+    reg = load_roster(path)
+    assert [reg.battler(p["name"]) for p in ROSTER] == ROSTER
+    assert load_roster(path) is reg
+
+
+def test_bundled_roster():
+    reg = load_roster()
+    assert "pikachu" in reg
+    assert len(reg.moves) < sum(len(reg.species[i][3]) for i in range(len(reg)))
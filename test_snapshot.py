@@ -0,0 +1,75 @@
+import pkmon_core.pokeapi as api
+from pkmon_core.snapshot import Snapshot, build_snapshot
+
+CSV = {
+    "types.csv": "id,identifier,generation_id,damage_class_id\n1,normal,1,2\n13,electric,1,3\n",
+    "stats.csv": "id,damage_class_id,identifier,is_battle_only,game_index\n"
+                 "1,,hp,0,1\n2,2,attack,0,2\n3,2,defense,0,3\n4,3,special-attack,0,5\n"
+                 "5,3,special-defense,0,6\n6,,speed,0,4\n",
+    "abilities.csv": "id,identifier,generation_id,is_main_series\n9,static,3,1\n",
+    "languages.csv": "id,iso639,iso3166,identifier,official,order\n9,en,us,en,1,7\n",
+    "move_damage_classes.csv": "id,identifier\n1,status\n2,physical\n3,special\n",
+    "move_targets.csv": "id,identifier\n7,user\n10,selected-pokemon\n",
+    "moves.csv": "id,identifier,generation_id,type_id,power,pp,accuracy,priority,target_id,"
+                 "damage_class_id,effect_id,effect_chance\n"
+                 "85,thunderbolt,1,13,90,15,100,0,10,3,7,10\n"
+                 "98,quick-attack,1,1,40,30,100,1,10,2,104,\n"
+                 "104,double-team,1,1,,15,,0,7,1,17,\n",
+    "move_effect_prose.csv": "move_effect_id,local_language_id,short_effect,effect\n"
+                             "7,9,Has a $effect_chance% chance to paralyze the target.,Paralyzes.\n",
+    "move_meta_stat_changes.csv": "move_id,stat_id,change\n104,7,1\n",
+    "pokemon_species.csv": "id,identifier,generation_id,evolves_from_species_id,evolution_chain_id\n"
+                           "25,pikachu,1,172,10\n26,raichu,1,25,10\n172,pichu,2,,10\n"
+                           "10001,unchained,9,,\n",
+    "pokemon.csv": "id,identifier,species_id,height,weight,base_experience,order,is_default\n"
+                   "25,pikachu,25,4,60,112,35,1\n",
+    "pokemon_stats.csv": "pokemon_id,stat_id,base_stat,effort\n25,1,35,0\n25,2,55,0\n"
+                         "25,3,40,0\n25,4,50,0\n25,5,50,0\n25,6,90,2\n",
+    "pokemon_types.csv": "pokemon_id,type_id,slot\n25,13,1\n",
+    "pokemon_abilities.csv": "pokemon_id,ability_id,is_hidden,slot\n25,9,0,1\n",
+    "pokemon_moves.csv": "pokemon_id,version_group_id,move_id,pokemon_move_method_id,level,order\n"
+                         "25,1,98,1,1,\n25,1,85,4,,\n25,2,85,4,,\n",
+}
+
+
+def make_snapshot(tmp_path):
+    csv_dir = tmp_path / "csv"
+    csv_dir.mkdir()
+    for name, text in CSV.items():
+        (csv_dir / name).write_text(text)
+    path = str(tmp_path / "pokeapi.snap")
+    build_snapshot(str(csv_dir), path)
+    return path
+
+
+def test_snapshot_records(tmp_path):
+    snap = Snapshot(make_snapshot(tmp_path))
+    assert snap.get("pokemon/pikachu") == snap.get("pokemon/25")
+    assert snap.get_url("https://pokeapi.co/api/v2/move/85/")["power"] == 90
+    assert snap.get("move/double-team")["power"] is None
+    assert snap.get("move/double-team")["target"]["name"] == "user"
+    assert snap.get("pokemon/missingno") is None
+    chain = snap.get("evolution-chain/10")["chain"]
+    assert chain["species"]["name"] == "pichu"
+    assert chain["evolves_to"][0]["evolves_to"][0]["species"]["name"] == "raichu"
+
+
+def test_pokeapi_reads_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setenv("PKMON_SNAPSHOT", make_snapshot(tmp_path))
+    api.snapshot.cache_clear()
+    try:
+        pokemon = api.battle_pokemon("Pikachu")
+        assert pokemon["stats"]["speed"] == 90
+        assert pokemon["types"] == ["electric"]
+        assert [m["name"] for m in pokemon["moves"]] == ["thunderbolt", "quick-attack"]
+        assert pokemon["moves"][0]["effect"].startswith("Has a")
+        assert [m["damage_class"] for m in pokemon["moves"]] == ["special", "physical"]
+        assert pokemon["moves"][0]["target"] == "selected-pokemon"
+
+        data = api.fetch_pokemon_data("pikachu")
+        species = api.fetch_json(data["species"]["url"])
+        assert api.build_chain(species) == ["pichu", "pikachu", "raichu"]
+        unchained = api.fetch_json("https://pokeapi.co/api/v2/pokemon-species/unchained/")
+        assert api.build_chain(unchained) == []
+    finally:
+        api.snapshot.cache_clear()
@@ -0,0 +1,26 @@
+from pkmon_core.registry import load_roster
+from pkmon_core.store import BattleStore
+
+ROSTER = load_roster()
+A, B = ROSTER.battler("pikachu"), ROSTER.battler("charizard")
+
+
+def test_replay_matches_original(tmp_path):
+    store = BattleStore(str(tmp_path / "battles.db"))
+    originals = {}
+    for seed in (None, 1, 2):
+        battle_id, result = store.record(A, B, seed=seed, max_turns=30)
+        originals[battle_id] = result
+    store.record(B, A)
+
+    for battle_id, result in originals.items():
+        assert store.replay(battle_id) == result
+        assert store.verify(battle_id)
+    assert store.conn.execute("SELECT COUNT(*) FROM battlers").fetchone()[0] == 2
+
+
+def test_verify_detects_tampering():
+    store = BattleStore()
+    battle_id, _ = store.record(A, B, seed=3)
+    store.conn.execute("UPDATE battles SET winner = 'pikachu' WHERE id = ?", (battle_id,))
+    assert not store.verify(battle_id)
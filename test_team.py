@@ -0,0 +1,66 @@
+import json
+
+from pkmon_core.registry import DEFAULT_ROSTER, Registry
+from pkmon_core.team import MatchupMatrix, best_team, load_battlers, optimize_team
+
+
+def battler(name, types, hp, atk, dfn, spe, moves):
+    return {
+        "name": name,
+        "types": types,
+        "stats": {"hp": hp, "attack": atk, "defense": dfn, "special-attack": atk,
+                  "special-defense": dfn, "speed": spe},
+        "moves": [{"name": m, "type": t, "power": p} for m, t, p in moves],
+    }
+
+
+ROSTER = [
+    battler("blastoise", ["water"], 79, 83, 100, 78, [("surf", "water", 90)]),
+    battler("arcanine", ["fire"], 90, 110, 80, 95, [("flamethrower", "fire", 90)]),
+    battler("venusaur", ["grass"], 80, 82, 83, 80, [("razor-leaf", "grass", 55)]),
+    battler("raichu", ["electric"], 60, 90, 55, 110, [("thunderbolt", "electric", 90)]),
+    battler("golem", ["rock", "ground"], 80, 120, 130, 45, [("earthquake", "ground", 100)]),
+]
+
+
+def test_optimize_prefers_covering_team():
+    W = [[1.0, 0.0], [0.0, 1.0], [0.6, 0.6]]
+    team, score = optimize_team(W, size=2, seed=0)
+    assert sorted(team) == [0, 1]
+    assert score == 1.0
+
+
+def test_matrix_is_cached_and_complementary(tmp_path):
+    reg = Registry.from_roster(ROSTER)
+    cache = str(tmp_path / "matchups.json")
+    matrix = MatchupMatrix(reg, battles=8, cache_path=cache)
+    result = best_team(reg.names(), ["golem", "arcanine"], matrix, size=2, seed=0, workers=1)
+    assert len(result["team"]) == 2
+    assert (matrix.table(["arcanine"], ["blastoise"])[0][0]
+            == 1 - matrix.table(["blastoise"], ["arcanine"])[0][0])
+
+    again = MatchupMatrix(reg, battles=8, cache_path=cache)
+    assert again.ensure(reg.names(), ["golem", "arcanine"]) == 0
+
+    # A changed battler under the same name is re-simulated
+    golem = dict(ROSTER[4], stats=dict(ROSTER[4]["stats"], speed=200))
+    reg.add_species(golem)
+    again = MatchupMatrix(reg, battles=8, cache_path=cache)
+    assert again.ensure(reg.names(), ["golem", "arcanine"]) == len(reg.names()) - 1
+
+    # ... and a cache from another engine version is ignored
+    with open(cache) as f:
+        data = json.load(f)
+    with open(cache, "w") as f:
+        json.dump(dict(data, engine="0"), f)
+    assert MatchupMatrix(reg, battles=8, cache_path=cache).rates == {}
+
+
+def test_load_battlers_reads_both_roster_formats(tmp_path):
+    bundled = load_battlers(["garchomp"], DEFAULT_ROSTER)
+    assert "garchomp" in bundled and "pikachu" in bundled
+
+    path = tmp_path / "roster.json"
+    path.write_text(json.dumps(ROSTER))
+    reg = load_battlers(["golem"], str(path))
+    assert reg.battler("golem") == ROSTER[4]